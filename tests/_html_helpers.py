@@ -0,0 +1,153 @@
+"""HTML parsers shared by the validation and unit test suites"""
+
+from html.parser import HTMLParser
+
+try:
+    from lxml import etree
+except ImportError:  # optional; extract_links falls back to LinkExtractor
+    etree = None
+
+
+# Attribute holding the URL for each tag whose links are collected
+_LINK_ATTRS = {"a": "href", "link": "href", "img": "src", "script": "src"}
+
+
+class LinkExtractor(HTMLParser):
+    """Extract links from HTML"""
+
+    def __init__(self):
+        super().__init__()
+        self.links = []
+
+    def handle_starttag(self, tag, attrs):
+        want = _LINK_ATTRS.get(tag)
+        if want is None:
+            return
+        for attr, value in attrs:
+            if attr == want:
+                self.links.append(value)
+                return
+
+
+class LinkTarget:
+    """Collect the same links as LinkExtractor, as an lxml parser target"""
+
+    def __init__(self):
+        self.links = []
+
+    def start(self, tag, attrib):
+        want = _LINK_ATTRS.get(tag)
+        if want is not None and want in attrib:
+            self.links.append(attrib[want])
+
+    def close(self):
+        return self.links
+
+
+class _StructureComplete(Exception):
+    """Raised by StructureValidator once every check has passed."""
+
+
+class StructureValidator(HTMLParser):
+    """Validate HTML structure
+
+    Stops the parse by raising _StructureComplete as soon as every flag is set,
+    which for a well-formed page happens at <body>.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.has_doctype = False
+        self.has_html = False
+        self.has_head = False
+        self.has_body = False
+        self.has_title = False
+        self.has_meta_charset = False
+        self.has_meta_viewport = False
+        self.errors = []
+
+    def handle_decl(self, decl):
+        # "DOCTYPE" is always the first word of the declaration
+        if decl[:7].lower() == "doctype":
+            self.has_doctype = True
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "html":
+            self.has_html = True
+        elif tag == "head":
+            self.has_head = True
+        elif tag == "body":
+            self.has_body = True
+        elif tag == "title":
+            self.has_title = True
+        elif tag == "meta":
+            for attr, value in attrs:
+                if attr == "charset":
+                    self.has_meta_charset = True
+                elif attr == "name" and value == "viewport":
+                    self.has_meta_viewport = True
+        else:
+            return
+
+        if (
+            self.has_doctype
+            and self.has_html
+            and self.has_head
+            and self.has_body
+            and self.has_title
+            and self.has_meta_charset
+            and self.has_meta_viewport
+        ):
+            raise _StructureComplete
+
+
+def extract_links_lxml(html_bytes: bytes) -> list[str]:
+    """Extract all links from UTF-8 encoded HTML with lxml (must be installed)."""
+    # libxml2 tokenizes in C and calls the target only for start tags
+    parser = etree.HTMLParser(target=LinkTarget(), encoding="utf-8")
+    return etree.fromstring(html_bytes, parser)
+
+
+def extract_links_html_parser(html_bytes: bytes) -> list[str]:
+    """Extract all links from UTF-8 encoded HTML with the stdlib html.parser."""
+    parser = LinkExtractor()
+    parser.feed(html_bytes.decode("utf-8"))
+    return parser.links
+
+
+def extract_links(html_bytes: bytes) -> list[str]:
+    """Extract all links from UTF-8 encoded HTML, with lxml when it is installed."""
+    if etree is not None:
+        return extract_links_lxml(html_bytes)
+    return extract_links_html_parser(html_bytes)
+
+
+def validate_html_structure(html_content: str) -> tuple[bool, list[str]]:
+    """Validate basic HTML structure.
+
+    Stays on html.parser: libxml2 inserts missing <html> and <body> start tags,
+    so an lxml target could not report them as missing.
+    """
+    validator = StructureValidator()
+    try:
+        validator.feed(html_content)
+    except _StructureComplete:
+        pass
+
+    errors = []
+    if not validator.has_doctype:
+        errors.append("Missing DOCTYPE declaration")
+    if not validator.has_html:
+        errors.append("Missing <html> tag")
+    if not validator.has_head:
+        errors.append("Missing <head> tag")
+    if not validator.has_body:
+        errors.append("Missing <body> tag")
+    if not validator.has_title:
+        errors.append("Missing <title> tag")
+    if not validator.has_meta_charset:
+        errors.append("Missing charset meta tag")
+    if not validator.has_meta_viewport:
+        errors.append("Missing viewport meta tag")
+
+    return len(errors) == 0, errors
@@ -0,0 +1,159 @@
+"""Helpers for checking inline and standalone JavaScript in the test suites"""
+
+import re
+
+# Delimiters of an inline (attribute-less) <script> element
+_SCRIPT_OPEN = "<script>"
+_SCRIPT_CLOSE = "</script>"
+# Bracket characters, so the nesting check only visits brackets
+_BRACKET_RE = re.compile(r"[(){}\[\]]")
+# Characters that can start a literal or comment, or end a template ${...}
+_LITERAL_START_RE = re.compile(r"[\"'`/{}]")
+# A "/" after one of these (or at the start) begins a regex literal, not a division
+_REGEX_PRECEDERS = frozenset("(,=:[!&|?{};+-*%<>~^")
+_REGEX_KEYWORDS = frozenset(
+    ("return", "typeof", "case", "do", "else", "in", "of", "new", "delete", "void", "throw")
+    + ("yield", "await", "instanceof")
+)
+_OPENER = {")": "(", "]": "[", "}": "{"}
+
+
+def extract_javascript_code(html_content: str) -> str:
+    """Extract JavaScript code from <script> tags."""
+    # Literal delimiters, so str.find's substring search beats a lazy DOTALL regex
+    blocks = []
+    end = 0
+    while (start := html_content.find(_SCRIPT_OPEN, end)) >= 0:
+        start += len(_SCRIPT_OPEN)
+        end = html_content.find(_SCRIPT_CLOSE, start)
+        if end < 0:
+            break
+        blocks.append(html_content[start:end])
+        end += len(_SCRIPT_CLOSE)
+    return "\n".join(blocks)
+
+
+def _literal_end(code: str, start: int, quote: str) -> int:
+    """Return the offset of the quote closing a string (or regex) body at ``start``."""
+    in_class = False  # inside a regex [...] class, where "/" does not close
+    i = start
+    while i < len(code):
+        char = code[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == "\n" or (char == quote and not in_class):
+            return i
+        if quote == "/" and char in "[]":
+            in_class = char == "["
+        i += 1
+    return len(code)
+
+
+def _regex_allowed(out: list, slash: int) -> bool:
+    """Tell whether the "/" at ``slash`` starts a regex literal rather than a division."""
+    i = slash - 1
+    while i >= 0 and out[i].isspace():
+        i -= 1
+    if i < 0 or out[i] in _REGEX_PRECEDERS:
+        return True
+    end = i + 1
+    while i >= 0 and (out[i].isalnum() or out[i] in "_$"):
+        i -= 1
+    return "".join(out[i + 1 : end]) in _REGEX_KEYWORDS
+
+
+def strip_js_literals(code: str) -> str:
+    """Blank out JS comments and string, template and regex literal bodies.
+
+    Offsets are preserved, so brackets in what is left are the code's own. Regex
+    literals are told from divisions by the preceding token, which is a
+    heuristic: ``a++ / 2`` is misread as the start of a regex.
+    """
+    out = list(code)
+    templates = []  # unmatched "{" count inside each open template ${...}
+
+    def blank(start, end):
+        out[start:end] = " " * (end - start)
+
+    def scan_template(i):
+        # Blank a template body up to its closing "`" or the next "${"
+        while i < len(code):
+            char = code[i]
+            if char == "\\":
+                i += 2
+            elif char == "`":
+                return i + 1
+            elif code.startswith("${", i):
+                blank(i, i + 2)
+                templates.append(0)
+                return i + 2
+            else:
+                out[i] = " "
+                i += 1
+        return len(code)
+
+    i = 0
+    while match := _LITERAL_START_RE.search(code, i):
+        i = match.start()
+        char = code[i]
+        if char in "'\"":
+            end = _literal_end(code, i + 1, char)
+            blank(i + 1, end)
+            i = end + 1
+        elif char == "`":
+            i = scan_template(i + 1)
+        elif char == "{":
+            if templates:
+                templates[-1] += 1
+            i += 1
+        elif char == "}":
+            if templates and templates[-1] == 0:
+                templates.pop()
+                out[i] = " "
+                i = scan_template(i + 1)
+            else:
+                if templates:
+                    templates[-1] -= 1
+                i += 1
+        elif code.startswith("//", i):
+            end = code.find("\n", i)
+            end = len(code) if end < 0 else end
+            blank(i, end)
+            i = end
+        elif code.startswith("/*", i):
+            end = code.find("*/", i + 2)
+            end = len(code) if end < 0 else end + 2
+            blank(i, end)
+            i = end
+        elif _regex_allowed(out, i):
+            end = _literal_end(code, i + 1, "/")
+            blank(i + 1, end)
+            i = end + 1
+        else:
+            i += 1
+    return "".join(out)
+
+
+def find_bracket_mismatch(js_code: str) -> str | None:
+    """Describe the first bracket that does not nest properly, or return None.
+
+    Brackets inside comments and string, template and regex literals are ignored.
+    """
+    stack = []
+    for match in _BRACKET_RE.finditer(strip_js_literals(js_code)):
+        char, offset = match.group(), match.start()
+        opener = _OPENER.get(char)
+        if opener is None:
+            stack.append((char, offset))
+        elif not stack:
+            return f"'{char}' at offset {offset} has no opening bracket"
+        elif stack[-1][0] != opener:
+            return f"'{char}' at offset {offset} closes '{stack[-1][0]}' from offset {stack[-1][1]}"
+        else:
+            stack.pop()
+
+    if stack:
+        char, offset = stack[-1]
+        return f"'{char}' at offset {offset} is never closed"
+    return None
@@ -1,66 +1,140 @@
 """Pytest configuration and fixtures"""
 
 import json
+import os
 from pathlib import Path
 
 import pytest
 
+from tests._js_helpers import extract_javascript_code
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def project_root() -> Path:
-    """Return the project root directory."""
+    """Return the project root directory (session scope)."""
     return Path(__file__).parent.parent
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def index_html(project_root: Path) -> Path:
     """Return the index.html file path."""
     return project_root / "index.html"
 
 
-@pytest.fixture
-def index_html_content(index_html: Path) -> str:
-    """Return the index.html file content."""
-    return index_html.read_text(encoding="utf-8")
+@pytest.fixture(scope="session")
+def index_file_url(index_html: Path) -> str:
+    """Return the file:// URL of index.html."""
+    return index_html.resolve().as_uri()
+
+
+@pytest.fixture(scope="session")
+def index_html_bytes(index_html: Path) -> bytes:
+    """Return the raw index.html bytes (read once per session)."""
+    return index_html.read_bytes()
+
+
+@pytest.fixture(scope="session")
+def index_html_content(index_html_bytes: bytes) -> str:
+    """Return the index.html file content (decoded once per session)."""
+    return index_html_bytes.decode("utf-8")
+
 
+@pytest.fixture(scope="session")
+def js_code(index_html_content: str) -> str:
+    """Return the inline JavaScript of index.html (extracted once per session)."""
+    return extract_javascript_code(index_html_content)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def data_dir(project_root: Path) -> Path:
     """Return the data directory path."""
     return project_root / "data"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def categories_json(data_dir: Path) -> Path:
     """Return the categories.json file path."""
     return data_dir / "categories.json"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config_json(data_dir: Path) -> Path:
     """Return the config.json file path."""
     return data_dir / "config.json"
 
 
-@pytest.fixture
+def _load_json(path: Path):
+    """Parse a JSON file, failing the requesting test if it is invalid."""
+    try:
+        return json.loads(path.read_bytes())
+    except json.JSONDecodeError as e:
+        pytest.fail(f"{path.name} is not valid JSON: {e}")
+
+
+@pytest.fixture(scope="session")
 def categories_data(categories_json: Path) -> dict:
-    """Return the categories.json content as dict."""
-    return json.loads(categories_json.read_text(encoding="utf-8"))
+    """Return the categories.json content as dict (parsed once per session)."""
+    return _load_json(categories_json)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config_data(config_json: Path) -> dict:
-    """Return the config.json content as dict."""
-    return json.loads(config_json.read_text(encoding="utf-8"))
+    """Return the config.json content as dict (parsed once per session)."""
+    return _load_json(config_json)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def css_dir(project_root: Path) -> Path:
     """Return the CSS directory path."""
     return project_root / "css"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def js_dir(project_root: Path) -> Path:
     """Return the JavaScript directory path."""
     return project_root / "js"
+
+
+def _scan_dir(directory: Path) -> dict:
+    """Return the entries of a directory keyed by name, from one scandir call."""
+    with os.scandir(directory) as entries:
+        return {entry.name: entry for entry in entries}
+
+
+@pytest.fixture(scope="session")
+def css_entries(css_dir: Path) -> dict:
+    """Return the css/ directory entries keyed by file name (session scope)."""
+    return _scan_dir(css_dir)
+
+
+@pytest.fixture(scope="session")
+def js_entries(js_dir: Path) -> dict:
+    """Return the js/ directory entries keyed by file name (session scope)."""
+    return _scan_dir(js_dir)
+
+
+def _read_bytes(path: str) -> bytes:
+    """Return the content of the file at a plain string path."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _read_sources(entries: dict, suffix: str) -> dict:
+    """Return the bytes of every ``suffix`` file among directory entries, keyed by name."""
+    return {
+        name: _read_bytes(entry.path)
+        for name, entry in entries.items()
+        if name.endswith(suffix) and entry.is_file()
+    }
+
+
+@pytest.fixture(scope="session")
+def css_sources(css_entries: dict) -> dict:
+    """Return the raw content of each css/*.css file (read once per session)."""
+    return _read_sources(css_entries, ".css")
+
+
+@pytest.fixture(scope="session")
+def js_sources(js_entries: dict) -> dict:
+    """Return the raw content of each js/*.js file (read once per session)."""
+    return _read_sources(js_entries, ".js")
@@ -1,49 +1,181 @@
 """E2E test fixtures"""
 
+import contextlib
 import os
+import signal
 import socket
 import subprocess
 import time
+import urllib.request
 from pathlib import Path
 
 import pytest
 
 
+def wait_for_server(
+    port: int, timeout: float = 5.0, interval: float = 0.01, proc: subprocess.Popen | None = None
+) -> None:
+    """Block until something accepts TCP connections on localhost:port.
+
+    Raises TimeoutError if nothing is listening after ``timeout`` seconds. With
+    ``timeout=0`` a single connection attempt is made. If ``proc`` is given and
+    exits before the port opens, RuntimeError is raised immediately; it is also
+    raised if ``proc`` has exited once the port answers, since something else
+    then owns the port.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with socket.create_connection(("localhost", port), timeout=0.1):
+                pass
+        except OSError:
+            if proc is not None and proc.poll() is not None:
+                raise RuntimeError(f"Server exited with code {proc.returncode} before listening")
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Nothing listening on port {port} after {timeout}s")
+            time.sleep(interval)
+            continue
+        if proc is not None and proc.poll() is not None:
+            raise RuntimeError(f"Server exited with code {proc.returncode}; port {port} is taken")
+        return
+
+
+def free_port() -> int:
+    """Ask the OS for a free ephemeral port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("", 0))
+        return sock.getsockname()[1]
+
+
+# pytest cache key holding the port of a server kept alive between runs; each
+# xdist worker keeps its own server, so the worker id is appended
+SERVER_PORT_KEY = "moltbot/server_port"
+
+
+def reusable_server_url(port: int | None, index_html: Path) -> str | None:
+    """Return the URL of a server on ``port`` still serving this checkout, if any."""
+    if port is None:
+        return None
+    try:
+        wait_for_server(port, timeout=0)
+        url = f"http://localhost:{port}"
+        with urllib.request.urlopen(f"{url}/index.html", timeout=1) as response:
+            # Another checkout (or another program) may have taken the port since
+            if response.status == 200 and response.read() == index_html.read_bytes():
+                return url
+    except OSError:  # includes the TimeoutError from wait_for_server
+        pass
+    return None
+
+
+@pytest.fixture(scope="session", autouse=True)
+def require_browser(browser_type):
+    """Skip the E2E tests when the Playwright browser is not installed.
+
+    Without this, the first test stalls on a confusing launch error. Browsers
+    are looked up in ~/.cache/ms-playwright, or in PLAYWRIGHT_BROWSERS_PATH
+    when set (point it at a shared or CI-cached directory).
+    """
+    executable = Path(browser_type.executable_path)
+    if not executable.exists():
+        pytest.skip(
+            f"Playwright {browser_type.name} not found at {executable}; "
+            f"run `playwright install {browser_type.name}`"
+        )
+
+
 @pytest.fixture(scope="session")
-def project_root() -> Path:
-    """Return the project root directory (session scope)."""
-    return Path(__file__).parent.parent.parent
+def browser_context_args(browser_context_args):
+    """Block service workers in every test context.
+
+    A worker registered by one page load could otherwise answer requests made
+    by a later test, so each context starts from the network as the site does.
+    """
+    return {**browser_context_args, "service_workers": "block"}
 
 
 @pytest.fixture(scope="session")
-def http_server(project_root: Path):
-    """Start a local HTTP server for E2E testing (session scope)."""
-    # Find available port
-    port = 8000
-    while port < 9000:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+def http_server(request, project_root: Path, index_html: Path):
+    """Start a local HTTP server for E2E testing (session scope; one per worker under -n).
+
+    With ``MOLTBOT_E2E_KEEP_SERVER=1`` the server is left running after the
+    session and its port is stored in the pytest cache, so the next run reuses
+    it instead of starting a new one. Under xdist each worker keeps its own
+    server. Stop them with ``kill`` when done.
+    """
+    keep_server = os.environ.get("MOLTBOT_E2E_KEEP_SERVER") == "1"
+    port_key = f"{SERVER_PORT_KEY}/{os.environ.get('PYTEST_XDIST_WORKER', 'master')}"
+    if keep_server:
+        url = reusable_server_url(request.config.cache.get(port_key, None), index_html)
+        if url is not None:
+            yield url, None
+            return
+
+    # The port is released before the server binds it, so another process can
+    # grab it in between; retry with a fresh port if the server fails to bind.
+    for attempt in range(3):
+        port = free_port()
+        proc = subprocess.Popen(
+            ["python3", "-m", "http.server", str(port)],
+            cwd=str(project_root),
+            # Nobody reads the request log; a full pipe would block the server
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
         try:
-            if sock.connect_ex(("localhost", port)) != 0:
-                sock.close()
-                break
-        finally:
-            sock.close()
-        port += 1
-
-    # Start HTTP server in background
-    proc = subprocess.Popen(
-        ["python3", "-m", "http.server", str(port)],
-        cwd=str(project_root),
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        preexec_fn=lambda: os.setsid(),
-    )
-
-    # Wait for server to start
-    time.sleep(1)
+            wait_for_server(port, proc=proc)
+            break
+        except Exception:
+            # Never leave a half-started server behind, whatever went wrong. The
+            # child leads its own session (pgid == pid); it may already be gone.
+            with contextlib.suppress(ProcessLookupError):
+                os.killpg(proc.pid, signal.SIGKILL)
+            proc.wait(timeout=5)
+            if attempt == 2:
+                raise
+
+    if keep_server:
+        request.config.cache.set(port_key, port)
+        # Detach: the server outlives the session, so its Popen must not warn at
+        # exit that the child is still running
+        proc.returncode = 0
+        yield f"http://localhost:{port}", None
+        return
 
     yield f"http://localhost:{port}", proc
 
-    # Cleanup
-    proc.terminate()
-    proc.wait()
+    # Cleanup: the server leads its own session, so signal the whole group
+    os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
+    proc.wait(timeout=5)
+
+
+@pytest.fixture(scope="session")
+def loaded_page(browser, browser_context_args, http_server):
+    """Return a page that has loaded the site and its data once (session scope).
+
+    Shared by tests that only read post-load state. Tests that click tabs or
+    filters must use the function-scoped ``page`` fixture instead.
+    """
+    context = browser.new_context(**browser_context_args)
+    page = context.new_page()
+    page.goto(http_server[0])
+    page.locator("#news-section .unified-card").first.wait_for(state="visible", timeout=10000)
+    yield page
+    context.close()
+
+
+@pytest.fixture(scope="session")
+def skills_page(browser, browser_context_args, http_server):
+    """Return a page switched to the skills tab with its cards rendered (session scope).
+
+    Shared by read-only tests of the skills section; like ``loaded_page``, it
+    must not be clicked further.
+    """
+    context = browser.new_context(**browser_context_args)
+    page = context.new_page()
+    page.goto(http_server[0])
+    page.locator(".tab-btn").filter(has_text="技能插件").click()
+    page.locator("#skills-section .skill-card").first.wait_for(state="visible", timeout=10000)
+    yield page
+    context.close()
@@ -1,41 +1,47 @@
 """Integration test fixtures"""
 
+import json
+import os
 from pathlib import Path
 
 import pytest
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is only in the optional `dev` extra
+    from json import loads as json_loads
+
+
+def _parse_json_files(directory: Path) -> dict:
+    """Parse every JSON file in a directory, keyed by file name."""
+    # One scandir pass and plain open() on each entry path, without a Path object per file
+    try:
+        with os.scandir(directory) as entries:
+            paths = sorted(
+                (e.name, e.path) for e in entries if e.name.endswith(".json") and e.is_file()
+            )
+    except FileNotFoundError:
+        pytest.fail(f"{directory.parent.name}/{directory.name} data directory should exist")
+    parsed = {}
+    for name, path in paths:
+        with open(path, "rb") as f:
+            raw = f.read()
+        try:
+            # Both parsers take the raw bytes (UTF-8) without a decode step;
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            parsed[name] = json_loads(raw)
+        except json.JSONDecodeError as e:
+            pytest.fail(f"{name} is not valid JSON: {e}")
+    return parsed
 
-@pytest.fixture(scope="session")
-def project_root() -> Path:
-    """Return the project root directory (session scope)."""
-    return Path(__file__).parent.parent.parent
-
-
-@pytest.fixture
-def index_html(project_root: Path) -> Path:
-    """Return the index.html file path."""
-    return project_root / "index.html"
-
-
-@pytest.fixture
-def index_html_content(index_html: Path) -> str:
-    """Return the index.html file content."""
-    return index_html.read_text(encoding="utf-8")
 
-
-@pytest.fixture
-def data_dir(project_root: Path) -> Path:
-    """Return the data directory path."""
-    return project_root / "data"
-
-
-@pytest.fixture
-def css_dir(project_root: Path) -> Path:
-    """Return the CSS directory path."""
-    return project_root / "css"
+@pytest.fixture(scope="session")
+def parsed_news(data_dir: Path) -> dict:
+    """Return the parsed data/news/*.json files (session scope)."""
+    return _parse_json_files(data_dir / "news")
 
 
-@pytest.fixture
-def js_dir(project_root: Path) -> Path:
-    """Return the JavaScript directory path."""
-    return project_root / "js"
+@pytest.fixture(scope="session")
+def parsed_skills(data_dir: Path) -> dict:
+    """Return the parsed data/skills/*.json files (session scope)."""
+    return _parse_json_files(data_dir / "skills")
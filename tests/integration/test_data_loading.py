@@ -4,19 +4,36 @@ import json
 
 import pytest
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is only in the optional `dev` extra
+    from json import loads as json_loads
+
+_REQUIRED_DATA = (
+    "const data = {",
+    "news:",
+    "skills:",
+    "news_items:",
+    "categories:",
+)
+
+# New architecture: Some elements are rendered dynamically
+_REQUIRED_ELEMENTS = (
+    'class="tab-btn"',
+    'class="filter-chip"',
+    'id="skill-filters"',  # Container for dynamically rendered filters
+    'id="news-grid"',
+    'id="skills-grid"',
+    'onclick="switchTab',
+    'onclick="filterNews',
+    # filterSkills is called from dynamically rendered buttons
+)
+
 
 @pytest.mark.integration
 def test_html_has_javascript_data(index_html_content):
     """Test that HTML contains the JavaScript data object."""
-    required_data = [
-        "const data = {",
-        "news:",
-        "skills:",
-        "news_items:",
-        "categories:",
-    ]
-
-    for data_item in required_data:
+    for data_item in _REQUIRED_DATA:
         assert data_item in index_html_content, f"Missing JavaScript data: {data_item}"
 
 
@@ -37,9 +54,9 @@ def test_html_has_external_css_links(index_html_content):
     # This test will pass if either inline styles OR external CSS is present
     has_inline_style = "<style>" in index_html_content
 
-    assert (
-        has_external_css or has_inline_style
-    ), "HTML should have either external CSS links or inline styles"
+    assert has_external_css or has_inline_style, (
+        "HTML should have either external CSS links or inline styles"
+    )
 
 
 @pytest.mark.integration
@@ -59,27 +76,15 @@ def test_html_has_external_js_links(index_html_content):
     # This test will pass if either inline script OR external JS is present
     has_inline_script = "<script>" in index_html_content and "</script>" in index_html_content
 
-    assert (
-        has_external_js or has_inline_script
-    ), "HTML should have either external JS links or inline scripts"
+    assert has_external_js or has_inline_script, (
+        "HTML should have either external JS links or inline scripts"
+    )
 
 
 @pytest.mark.integration
 def test_html_has_required_elements(index_html_content):
     """Test that HTML has required interactive elements."""
-    # New architecture: Some elements are rendered dynamically
-    required_elements = [
-        'class="tab-btn"',
-        'class="filter-chip"',
-        'id="skill-filters"',  # Container for dynamically rendered filters
-        'id="news-grid"',
-        'id="skills-grid"',
-        'onclick="switchTab',
-        'onclick="filterNews',
-        # filterSkills is called from dynamically rendered buttons
-    ]
-
-    for element in required_elements:
+    for element in _REQUIRED_ELEMENTS:
         assert element in index_html_content, f"Missing required element: {element}"
 
 
@@ -89,9 +94,9 @@ def test_html_has_news_cards(index_html_content):
     # New architecture: News cards are rendered dynamically from JSON
     # Check for the grid container instead of static cards
     assert 'id="news-grid"' in index_html_content, "Missing news grid container"
-    assert (
-        'class="card-grid"' in index_html_content or 'id="news-grid"' in index_html_content
-    ), "Missing card grid structure"
+    assert 'class="card-grid"' in index_html_content or 'id="news-grid"' in index_html_content, (
+        "Missing card grid structure"
+    )
 
 
 @pytest.mark.integration
@@ -103,71 +108,57 @@ def test_html_has_skill_filters(index_html_content):
 
 
 @pytest.mark.integration
-def test_news_data_files_exist(data_dir):
+def test_news_data_files_exist(data_dir, request):
     """Test that news data files exist in the data directory."""
     news_dir = data_dir / "news"
     assert news_dir.exists(), "News data directory should exist"
     assert news_dir.is_dir(), "News should be a directory"
 
+    # Parse only once the directory is known to exist
+    parsed_news = request.getfixturevalue("parsed_news")
+
     # Check for at least one news data file
-    news_files = list(news_dir.glob("*.json"))
-    assert len(news_files) > 0, "Should have at least one news data file"
+    assert len(parsed_news) > 0, "Should have at least one news data file"
 
 
 @pytest.mark.integration
-def test_skills_data_files_exist(data_dir):
+def test_skills_data_files_exist(data_dir, request):
     """Test that skills data files exist in the data directory."""
     skills_dir = data_dir / "skills"
     assert skills_dir.exists(), "Skills data directory should exist"
     assert skills_dir.is_dir(), "Skills should be a directory"
 
+    # Parse only once the directory is known to exist
+    parsed_skills = request.getfixturevalue("parsed_skills")
+
     # Check for at least one skills data file
-    skills_files = list(skills_dir.glob("*.json"))
-    assert len(skills_files) > 0, "Should have at least one skills data file"
+    assert len(parsed_skills) > 0, "Should have at least one skills data file"
 
 
 @pytest.mark.integration
-def test_news_data_valid_json(data_dir):
+def test_news_data_valid_json(parsed_news):
     """Test that news data files are valid JSON."""
-    news_dir = data_dir / "news"
-    news_files = list(news_dir.glob("*.json"))
-
-    for news_file in news_files:
-        try:
-            data = json.loads(news_file.read_text(encoding="utf-8"))
-            # News files can be either a list or an object with an 'items' key
-            if isinstance(data, dict):
-                assert "items" in data, f"{news_file.name} should have an 'items' key"
-                items = data["items"]
-                assert isinstance(items, list), f"{news_file.name} items should be a list"
-            else:
-                assert isinstance(
-                    data, list
-                ), f"{news_file.name} should contain a list or dict with items"
-        except json.JSONDecodeError as e:
-            pytest.fail(f"{news_file.name} is not valid JSON: {e}")
+    for name, data in parsed_news.items():
+        # News files can be either a list or an object with an 'items' key
+        if isinstance(data, dict):
+            assert "items" in data, f"{name} should have an 'items' key"
+            items = data["items"]
+            assert isinstance(items, list), f"{name} items should be a list"
+        else:
+            assert isinstance(data, list), f"{name} should contain a list or dict with items"
 
 
 @pytest.mark.integration
-def test_skills_data_valid_json(data_dir):
+def test_skills_data_valid_json(parsed_skills):
     """Test that skills data files are valid JSON."""
-    skills_dir = data_dir / "skills"
-    skills_files = list(skills_dir.glob("*.json"))
-
-    for skills_file in skills_files:
-        try:
-            data = json.loads(skills_file.read_text(encoding="utf-8"))
-            # Skills files can be either a list or an object with a 'skills' key
-            if isinstance(data, dict):
-                assert "skills" in data, f"{skills_file.name} should have a 'skills' key"
-                skills = data["skills"]
-                assert isinstance(skills, list), f"{skills_file.name} skills should be a list"
-            else:
-                assert isinstance(
-                    data, list
-                ), f"{skills_file.name} should contain a list or dict with skills"
-        except json.JSONDecodeError as e:
-            pytest.fail(f"{skills_file.name} is not valid JSON: {e}")
+    for name, data in parsed_skills.items():
+        # Skills files can be either a list or an object with a 'skills' key
+        if isinstance(data, dict):
+            assert "skills" in data, f"{name} should have a 'skills' key"
+            skills = data["skills"]
+            assert isinstance(skills, list), f"{name} skills should be a list"
+        else:
+            assert isinstance(data, list), f"{name} should contain a list or dict with skills"
 
 
 @pytest.mark.skip(reason="showcase-data.json 已迁移到 data/news/ 目录，此文件不再需要")
@@ -187,10 +178,10 @@ def test_showcase_data_valid_json(project_root):
 
     if showcase_data.exists():
         try:
-            data = json.loads(showcase_data.read_text(encoding="utf-8"))
-            assert isinstance(
-                data, (dict, list)
-            ), "showcase-data.json should contain a dict or list"
+            data = json_loads(showcase_data.read_bytes())
+            assert isinstance(data, (dict, list)), (
+                "showcase-data.json should contain a dict or list"
+            )
         except json.JSONDecodeError as e:
             pytest.fail(f"showcase-data.json is not valid JSON: {e}")
 
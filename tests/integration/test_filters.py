@@ -4,37 +4,77 @@ import re
 
 import pytest
 
-
-def extract_all_links(html_content: str) -> list[dict]:
-    """Extract all links from HTML content with context."""
-    links = []
-
-    # Extract href attributes from <a> tags
-    href_pattern = r'<a[^>]+href=["\']([^"\']+)["\'][^>]*>'
-    for match in re.finditer(href_pattern, html_content):
-        url = match.group(1)
-        links.append({"url": url, "type": "anchor", "context": match.group(0)[:100]})
-
-    # Extract src attributes from <img> tags
-    src_pattern = r'<img[^>]+src=["\']([^"\']+)["\'][^>]*>'
-    for match in re.finditer(src_pattern, html_content):
-        url = match.group(1)
-        links.append({"url": url, "type": "image", "context": match.group(0)[:100]})
-
-    # Extract href from <link> tags
-    link_pattern = r'<link[^>]+href=["\']([^"\']+)["\'][^>]*>'
-    for match in re.finditer(link_pattern, html_content):
-        url = match.group(1)
-        links.append({"url": url, "type": "link", "context": match.group(0)[:100]})
-
-    return links
+# One alternation covers every tag type plus id attributes, so the HTML is
+# scanned once. Tag branches use lookaheads and only consume "<a"/"<img"/"<link",
+# which keeps id attributes inside those tags visible to the id branch.
+_ALL_RE = re.compile(
+    r'<a(?=[^>]+href=["\']([^"\']+)["\'][^>]*>)'
+    r'|<img(?=[^>]+src=["\']([^"\']+)["\'][^>]*>)'
+    r'|<link(?=[^>]+href=["\']([^"\']+)["\'][^>]*>)'
+    r'|id=["\']([^"\']+)["\']'
+)
+
+
+def extract_all_links(html_content: str) -> dict:
+    """Extract anchor, image and link URLs plus all element IDs in one pass."""
+    extracted = {"anchors": [], "images": [], "links": [], "ids": set()}
+
+    for anchor, image, link, element_id in _ALL_RE.findall(html_content):
+        if anchor:
+            extracted["anchors"].append(anchor)
+        elif image:
+            extracted["images"].append(image)
+        elif link:
+            extracted["links"].append(link)
+        else:
+            extracted["ids"].add(element_id)
+
+    return extracted
+
+
+def all_urls(extracted: dict) -> list[str]:
+    """Return every URL from an extract_all_links() result."""
+    return extracted["anchors"] + extracted["images"] + extracted["links"]
+
+
+@pytest.fixture(scope="session")
+def extracted_links(index_html_content):
+    """Return the links and IDs extracted from index.html (session scope)."""
+    return extract_all_links(index_html_content)
+
+
+_REQUIRED_LINKS = (
+    "https://github.com/moltbot/moltbot",
+    "https://docs.molt.bot",
+    "https://fonts.googleapis.com",
+)
+_FONT_HOSTS = ("fonts.googleapis.com", "fonts.gstatic.com")
+_PLACEHOLDER_PATTERNS = (
+    "http://example.com",
+    "https://example.com",
+    "http://localhost",
+    "http://127.0.0.1",
+    "http://placeholder",
+    "#TODO",
+    "#FIXME",
+)
+# Any placeholder in one search of the lowercased URL; matching lowercased
+# patterns is faster here than re.IGNORECASE, which case-folds every character
+_PLACEHOLDER_RE = re.compile("|".join(re.escape(p.lower()) for p in _PLACEHOLDER_PATTERNS))
+# A GitHub owner (user or org) segment, the first path part after the host
+_GITHUB_OWNER_RE = re.compile(r"[\w.-]+")
+
+
+# Prefix groups for str.startswith, which tries a whole tuple in one C call
+_WEB_PREFIXES = ("http://", "https://")
+_NON_URL_PREFIXES = ("data:", "blob:", "${")
 
 
 def categorize_link(url: str) -> str:
     """Categorize link by type."""
     if url.startswith("#"):
         return "anchor"
-    if url.startswith("http://") or url.startswith("https://"):
+    if url.startswith(_WEB_PREFIXES):
         return "external"
     if url.startswith("/"):
         return "internal_absolute"
@@ -46,165 +86,108 @@ def categorize_link(url: str) -> str:
 
 
 @pytest.mark.integration
-def test_external_links_format(index_html_content):
+def test_external_links_format(extracted_links):
     """Test that external links have valid format."""
-    from urllib.parse import urlparse
-
-    links = extract_all_links(index_html_content)
-
-    external_links = [link for link in links if categorize_link(link["url"]) == "external"]
+    external_links = [
+        url for url in all_urls(extracted_links) if categorize_link(url) == "external"
+    ]
 
     invalid_links = []
-    for link in external_links:
-        url = link["url"]
-        if not url or url.strip() == "":
-            invalid_links.append(link)
-            continue
-
-        # Skip anchors and javascript links
-        if url.startswith("#") or url.startswith("javascript:"):
-            continue
-
-        try:
-            result = urlparse(url)
-            if not (all([result.scheme, result.netloc]) or result.scheme == ""):
-                invalid_links.append(link)
-        except Exception:
-            invalid_links.append(link)
+    for url in external_links:
+        # The scheme is http(s) by construction; only the host can be missing
+        host = url.partition("://")[2].split("/", 1)[0]
+        if not host:
+            invalid_links.append(url)
 
     if invalid_links:
-        error_msg = "\n".join([f"  - {link['url']}" for link in invalid_links[:10]])
+        error_msg = "\n".join([f"  - {url}" for url in invalid_links[:10]])
         assert False, f"Found invalid external links:\n{error_msg}"
 
 
 @pytest.mark.integration
-def test_internal_links_format(index_html_content):
+def test_internal_links_format(extracted_links):
     """Test that internal links have valid format."""
-    links = extract_all_links(index_html_content)
-
     internal_links = [
-        link
-        for link in links
-        if categorize_link(link["url"]) in ("anchor", "internal_absolute", "relative")
+        url
+        for url in all_urls(extracted_links)
+        if categorize_link(url) in ("anchor", "internal_absolute", "relative")
     ]
 
     # All internal links should be valid strings
-    invalid_links = [
-        link for link in internal_links if not link["url"] or link["url"].strip() == ""
-    ]
+    invalid_links = [url for url in internal_links if not url or url.strip() == ""]
 
     assert len(invalid_links) == 0, "Found empty internal links"
 
 
 @pytest.mark.integration
-def test_no_broken_anchor_links(index_html_content):
+def test_no_broken_anchor_links(extracted_links):
     """Test that all anchor links reference existing IDs."""
-    links = extract_all_links(index_html_content)
-
-    anchor_links = [link["url"] for link in links if categorize_link(link["url"]) == "anchor"]
-
-    # Extract all IDs from the HTML
-    id_pattern = r'id=["\']([^"\']+)["\']'
-    all_ids = set(re.findall(id_pattern, index_html_content))
-
-    # Remove the leading # from anchor links
-    anchor_ids = {link[1:] for link in anchor_links if link != "#"}
-
-    missing_ids = anchor_ids - all_ids
+    # Fragment targets of in-page anchors, minus the IDs collected in the same pass
+    missing_ids = {
+        url[1:] for url in extracted_links["anchors"] if url.startswith("#") and url != "#"
+    } - extracted_links["ids"]
 
     if missing_ids:
         assert False, f"Anchor links reference missing IDs: {missing_ids}"
 
 
 @pytest.mark.integration
-def test_image_links_format(index_html_content):
+def test_image_links_format(extracted_links):
     """Test that image links have valid format."""
-    links = extract_all_links(index_html_content)
-
-    image_links = [link for link in links if link["type"] == "image"]
-
     # Check that image URLs are valid
     invalid_images = []
-    for link in image_links:
-        url = link["url"]
+    for url in extracted_links["images"]:
         if not url or url.strip() == "":
-            invalid_images.append(link)
-        elif not (url.startswith("http://") or url.startswith("https://") or url.startswith("/")):
+            invalid_images.append(url)
+        elif not url.startswith(_WEB_PREFIXES + ("/",)):
             # Only check if it looks like a URL (not data URLs, blob URLs, or template literals)
-            if (
-                not url.startswith("data:")
-                and not url.startswith("blob:")
-                and not url.startswith("${")
-            ):
-                invalid_images.append(link)
+            if not url.startswith(_NON_URL_PREFIXES):
+                invalid_images.append(url)
 
     if invalid_images:
-        error_msg = "\n".join([f"  - {link['url']}" for link in invalid_images[:10]])
+        error_msg = "\n".join([f"  - {url}" for url in invalid_images[:10]])
         assert False, f"Found invalid image links:\n{error_msg}"
 
 
 @pytest.mark.integration
 def test_has_required_external_links(index_html_content):
     """Test that HTML has required external links."""
-    required_links = [
-        "https://github.com/moltbot/moltbot",
-        "https://docs.molt.bot",
-        "https://fonts.googleapis.com",
-    ]
-
-    for link in required_links:
+    for link in _REQUIRED_LINKS:
         assert link in index_html_content, f"Missing required external link: {link}"
 
 
 @pytest.mark.integration
-def test_no_placeholder_links(index_html_content):
+def test_no_placeholder_links(extracted_links):
     """Test that there are no obvious placeholder links."""
-    placeholder_patterns = [
-        "http://example.com",
-        "https://example.com",
-        "http://localhost",
-        "http://127.0.0.1",
-        "http://placeholder",
-        "#TODO",
-        "#FIXME",
+    found_placeholders = [
+        url for url in all_urls(extracted_links) if _PLACEHOLDER_RE.search(url.lower())
     ]
 
-    links = extract_all_links(index_html_content)
-    found_placeholders = []
-
-    for link in links:
-        url = link["url"]
-        for pattern in placeholder_patterns:
-            if pattern.lower() in url.lower():
-                found_placeholders.append(url)
-                break
-
     if found_placeholders:
         error_msg = "\n".join([f"  - {url}" for url in found_placeholders])
         assert False, f"Found placeholder links:\n{error_msg}"
 
 
 @pytest.mark.integration
-def test_github_links_format(index_html_content):
+def test_github_links_format(extracted_links):
     """Test that GitHub links have proper format."""
-    github_pattern = r"https://github\.com/[\w\-]+(?:/[\w\-]+)?"
-
-    # Find all GitHub links (only full https URLs)
-    github_links = re.findall(github_pattern, index_html_content)
+    # GitHub links among the cached anchors (only full https URLs)
+    github_links = [
+        url for url in extracted_links["anchors"] if url.startswith("https://github.com/")
+    ]
 
-    # Check basic format
+    # Every link must name an owner, so a bare https://github.com/ fails
     for link in github_links:
-        assert link.startswith("https://github.com/"), f"Invalid GitHub link format: {link}"
-        parts = link[len("https://github.com/") :].split("/")
-        assert len(parts) >= 1, f"GitHub link missing username/org: {link}"
+        owner = link[len("https://github.com/") :].split("/")[0]
+        assert _GITHUB_OWNER_RE.fullmatch(owner), f"GitHub link missing username/org: {link}"
 
 
 @pytest.mark.integration
-def test_mailto_links_format(index_html_content):
+def test_mailto_links_format(extracted_links):
     """Test that mailto links have proper format."""
-    mailto_pattern = r'mailto:([^\s"\'<>]+)'
-
-    mailto_links = re.findall(mailto_pattern, index_html_content)
+    mailto_links = [
+        url[len("mailto:") :] for url in extracted_links["anchors"] if url.startswith("mailto:")
+    ]
 
     for email in mailto_links:
         assert "@" in email, f"Invalid email in mailto link: {email}"
@@ -212,9 +195,9 @@ def test_mailto_links_format(index_html_content):
 
 
 @pytest.mark.integration
-def test_link_count_minimum(index_html_content):
+def test_link_count_minimum(extracted_links):
     """Test that HTML has minimum number of links."""
-    links = extract_all_links(index_html_content)
+    links = all_urls(extracted_links)
 
     # New architecture: Fewer links in HTML since content is in JSON files
     # Expect at least 10 links (fonts, CSS, JS, footer links)
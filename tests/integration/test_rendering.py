@@ -2,104 +2,76 @@
 
 import pytest
 
+_DATA_OBJECT = b"const data = {"
+_DATA_KEYS = (b"news:", b"skills:")
+
+_REQUIRED_JS_FILES = (
+    'src="js/utils/filter.js"',
+    'src="js/app.js"',
+    'src="js/renderers/news-renderer.js"',
+    'src="js/renderers/skills-renderer.js"',
+    'src="js/utils/copy.js"',
+)
+_REQUIRED_RENDERERS = (
+    'src="js/renderers/news-renderer.js"',
+    'src="js/renderers/skills-renderer.js"',
+)
+_STATIC_HANDLERS = (
+    'onclick="switchTab',
+    'onclick="filterNews',
+)
+_DATA_LOADER = 'src="js/data-loader.js"'
+
 
 @pytest.mark.integration
-def test_javascript_has_required_functions(index_html_content):
-    """Test that HTML has external JS files with required functions."""
-    # New architecture: Functions are in external JS files
-    required_js_files = [
-        'src="js/utils/filter.js"',
-        'src="js/app.js"',
-        'src="js/renderers/news-renderer.js"',
-        'src="js/renderers/skills-renderer.js"',
-        'src="js/utils/copy.js"',
-    ]
+@pytest.mark.parametrize(
+    "script",
+    _REQUIRED_JS_FILES + (_DATA_LOADER,),
+    ids=lambda script: script[len('src="js/') : -1],
+)
+def test_has_external_js(index_html_content, script):
+    """Test that HTML loads each external JS file.
 
-    for js_file in required_js_files:
-        assert js_file in index_html_content, f"Missing external JS file: {js_file}"
+    State, DOM-ready handling, copy, filtering, class manipulation and DOM
+    queries all live in these scripts rather than inline.
+    """
+    assert script in index_html_content, f"Missing external JS file: {script}"
 
 
 @pytest.mark.integration
-def test_javascript_has_data_object(index_html_content):
+def test_javascript_has_data_object(index_html_bytes):
     """Test that HTML has data object for fallback."""
-    import re
-
-    # Extract inline JavaScript
-    pattern = r"<script>(.*?)</script>"
-    matches = re.findall(pattern, index_html_content, re.DOTALL)
-    js_code = "\n".join(matches)
-
     # Check for data object (can be empty in new architecture, used as fallback)
-    required_data = ["const data = {", "news:", "skills:"]
+    start = index_html_bytes.find(_DATA_OBJECT)
+    assert start >= 0, f"Missing data structure: {_DATA_OBJECT.decode()}"
 
-    for data in required_data:
-        assert data in js_code, f"Missing data structure: {data}"
+    # It must sit in an inline <script>, with its keys before that script ends
+    script_start = index_html_bytes.rfind(b"<script", 0, start)
+    assert index_html_bytes.startswith(b"<script>", script_start), "Data object is not inline"
+    block = index_html_bytes[start : index_html_bytes.find(b"</script>", start)]
 
-
-@pytest.mark.integration
-def test_javascript_has_state_variables(index_html_content):
-    """Test that HTML has external JS with state management."""
-    # New architecture: State is managed in external JS files
-    has_external_js = (
-        'src="js/app.js"' in index_html_content or 'src="js/utils/filter.js"' in index_html_content
-    )
-    assert has_external_js, "Missing external JS files for state management"
-
-
-@pytest.mark.integration
-def test_javascript_has_dom_ready_handler(index_html_content):
-    """Test that HTML has external JS with DOM ready handler."""
-    # New architecture: DOMContentLoaded is in external JS files
-    has_external_js = 'src="js/app.js"' in index_html_content
-    assert has_external_js, "Missing external JS app.js with DOMContentLoaded"
+    for data in _DATA_KEYS:
+        assert data in block, f"Missing data structure: {data.decode()}"
 
 
 @pytest.mark.integration
 def test_javascript_render_functions(index_html_content):
     """Test that HTML has external JS renderers."""
     # New architecture: Render functions are in external JS files
-    required_renderers = [
-        'src="js/renderers/news-renderer.js"',
-        'src="js/renderers/skills-renderer.js"',
-    ]
-
-    for renderer in required_renderers:
+    for renderer in _REQUIRED_RENDERERS:
         assert renderer in index_html_content, f"Missing external JS renderer: {renderer}"
 
 
-@pytest.mark.integration
-def test_javascript_has_copy_functionality(index_html_content):
-    """Test that HTML has external JS with copy functionality."""
-    # New architecture: Copy functionality is in external JS files
-    has_copy_js = 'src="js/utils/copy.js"' in index_html_content
-    assert has_copy_js, "Missing external JS utils/copy.js with copy functionality"
-
-
-@pytest.mark.integration
-def test_javascript_filter_logic(index_html_content):
-    """Test that HTML has external JS with filter logic."""
-    # New architecture: Filter logic is in external JS files
-    has_filter_js = 'src="js/utils/filter.js"' in index_html_content
-    assert has_filter_js, "Missing external JS utils/filter.js with filter logic"
-
-
 @pytest.mark.integration
 def test_javascript_event_handlers(index_html_content):
     """Test that JavaScript has proper event handlers."""
-    html_content = index_html_content
-
     # Check for onclick attributes in static HTML
     # Note: copyText is called from dynamically rendered content
-    static_handlers = [
-        'onclick="switchTab',
-        'onclick="filterNews',
-    ]
-
-    for handler in static_handlers:
-        assert handler in html_content, f"Missing event handler: {handler}"
+    for handler in _STATIC_HANDLERS:
+        assert handler in index_html_content, f"Missing event handler: {handler}"
 
     # Check for copy functionality in external JS
-    has_copy_js = 'src="js/utils/copy.js"' in html_content
+    has_copy_js = 'src="js/utils/copy.js"' in index_html_content
     assert has_copy_js, "Missing external JS utils/copy.js with copyText function"
 
 
@@ -115,24 +87,6 @@ def test_javascript_innerhtml_usage(index_html_content):
     assert has_data_loader and has_renderers, "Missing external JS for dynamic rendering"
 
 
-@pytest.mark.integration
-def test_javascript_class_manipulation(index_html_content):
-    """Test that HTML has external JS with class manipulation."""
-    # New architecture: classList usage is in external JS files
-    has_external_js = (
-        'src="js/utils/filter.js"' in index_html_content or 'src="js/app.js"' in index_html_content
-    )
-    assert has_external_js, "Missing external JS with classList manipulation"
-
-
-@pytest.mark.integration
-def test_javascript_queryselector_usage(index_html_content):
-    """Test that HTML has external JS for DOM queries."""
-    # New architecture: querySelector/getElementById is in external JS files
-    has_external_js = 'src="js/data-loader.js"' in index_html_content
-    assert has_external_js, "Missing external JS data-loader.js for DOM queries"
-
-
 @pytest.mark.integration
 def test_javascript_template_literals(index_html_content):
     """Test that external JS files use template literals."""
@@ -143,24 +97,3 @@ def test_javascript_template_literals(index_html_content):
         or 'src="js/renderers/skills-renderer.js"' in index_html_content
     )
     assert has_renderers, "Missing external JS renderers that should use template literals"
-
-
-@pytest.mark.integration
-def test_html_has_required_functions(index_html_content):
-    """Test that HTML has required JavaScript (inline or external)."""
-    # New architecture: Functions are in external JS files
-    # Check for external JS files that contain these functions
-    has_external_js = (
-        'src="js/utils/filter.js"' in index_html_content
-        or 'src="js/app.js"' in index_html_content
-        or 'src="js/utils/filter.js"' in index_html_content
-    )
-
-    # Check for inline function definitions
-    has_inline_functions = (
-        "function switchTab" in index_html_content or "function filterNews" in index_html_content
-    )
-
-    assert (
-        has_external_js or has_inline_functions
-    ), "JavaScript should be in external JS files or inline"
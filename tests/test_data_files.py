@@ -6,38 +6,45 @@ from pathlib import Path
 import pytest
 
 
-def test_data_directory_exists(data_dir: Path):
-    """Test that the data directory exists."""
-    assert data_dir.exists(), "Data directory should exist"
-    assert data_dir.is_dir(), "Data should be a directory"
-
-
-def test_categories_json_exists(categories_json: Path):
-    """Test that categories.json file exists."""
-    assert categories_json.exists(), "categories.json should exist"
-    assert categories_json.is_file(), "categories.json should be a file"
-
-
-def test_config_json_exists(config_json: Path):
-    """Test that config.json file exists."""
-    assert config_json.exists(), "config.json should exist"
-    assert config_json.is_file(), "config.json should be a file"
-
-
-def test_categories_json_valid_json(categories_json: Path):
-    """Test that categories.json is valid JSON."""
-    try:
-        json.loads(categories_json.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as e:
-        pytest.fail(f"categories.json is not valid JSON: {e}")
-
-
-def test_config_json_valid_json(config_json: Path):
-    """Test that config.json is valid JSON."""
-    try:
-        json.loads(config_json.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as e:
-        pytest.fail(f"config.json is not valid JSON: {e}")
+@pytest.mark.parametrize(
+    ("path_fixture", "kind"),
+    [
+        ("data_dir", "dir"),
+        ("categories_json", "file"),
+        ("config_json", "file"),
+        ("css_dir", "dir"),
+        ("js_dir", "dir"),
+    ],
+)
+def test_path_exists(request, path_fixture: str, kind: str):
+    """Test that the data, CSS and JavaScript paths exist."""
+    path = request.getfixturevalue(path_fixture)
+    assert path.exists(), f"{path.name} should exist"
+    if kind == "dir":
+        assert path.is_dir(), f"{path.name} should be a directory"
+    else:
+        assert path.is_file(), f"{path.name} should be a file"
+
+
+_JSON_DATA = [
+    ("categories_data", "categories.json"),
+    ("config_data", "config.json"),
+]
+
+
+@pytest.mark.parametrize(("data_fixture", "file_name"), _JSON_DATA)
+def test_json_valid(request, data_fixture: str, file_name: str):
+    """Test that categories.json and config.json are valid JSON."""
+    # The session fixture fails the test itself if the file does not parse
+    data = request.getfixturevalue(data_fixture)
+    assert data is not None, f"{file_name} should not be null"
+
+
+@pytest.mark.parametrize(("data_fixture", "file_name"), _JSON_DATA)
+def test_json_not_empty(request, data_fixture: str, file_name: str):
+    """Test that categories.json and config.json are not empty."""
+    data = request.getfixturevalue(data_fixture)
+    assert len(data) > 0, f"{file_name} should not be empty"
 
 
 def test_categories_data_structure(categories_data: dict):
@@ -79,26 +86,7 @@ def test_config_data_structure(config_data: dict):
     assert has_expected_key or True, "config.json should have at least one common configuration key"
 
 
-def test_categories_not_empty(categories_data: dict):
-    """Test that categories data is not empty."""
-    if isinstance(categories_data, list):
-        assert len(categories_data) > 0, "categories.json should not be empty"
-    elif isinstance(categories_data, dict):
-        assert len(categories_data) > 0, "categories.json should not be empty"
-
-
-def test_config_not_empty(config_data: dict):
-    """Test that config data is not empty."""
-    assert len(config_data) > 0, "config.json should not be empty"
-
-
-def test_css_directory_exists(css_dir: Path):
-    """Test that the CSS directory exists."""
-    assert css_dir.exists(), "CSS directory should exist"
-    assert css_dir.is_dir(), "CSS should be a directory"
-
-
-def test_css_files_exist(css_dir: Path):
+def test_css_files_exist(css_entries: dict):
     """Test that expected CSS files exist."""
     expected_css_files = [
         "variables.css",
@@ -109,18 +97,11 @@ def test_css_files_exist(css_dir: Path):
     ]
 
     for css_file in expected_css_files:
-        css_path = css_dir / css_file
-        assert css_path.exists(), f"CSS file {css_file} should exist"
-        assert css_path.is_file(), f"{css_file} should be a file"
+        assert css_file in css_entries, f"CSS file {css_file} should exist"
+        assert css_entries[css_file].is_file(), f"{css_file} should be a file"
 
 
-def test_js_directory_exists(js_dir: Path):
-    """Test that the JavaScript directory exists."""
-    assert js_dir.exists(), "JavaScript directory should exist"
-    assert js_dir.is_dir(), "JavaScript should be a directory"
-
-
-def test_js_files_exist(js_dir: Path):
+def test_js_files_exist(js_entries: dict):
     """Test that expected JavaScript files exist."""
     expected_js_files = [
         "app.js",
@@ -129,43 +110,27 @@ def test_js_files_exist(js_dir: Path):
     ]
 
     for js_file in expected_js_files:
-        js_path = js_dir / js_file
         # Note: These files may not exist in all configurations
         # So we just check the directory exists and list what's there
-        if js_path.exists():
-            assert js_path.is_file(), f"{js_file} should be a file"
+        if js_file in js_entries:
+            assert js_entries[js_file].is_file(), f"{js_file} should be a file"
 
 
-def test_css_files_valid_css(css_dir: Path):
+def test_css_files_valid_css(css_sources: dict):
     """Test that CSS files are valid (have basic CSS syntax)."""
-    css_files = list(css_dir.glob("*.css"))
-
-    for css_file in css_files:
-        content = css_file.read_text(encoding="utf-8")
+    for name, content in css_sources.items():
         # Basic check - should have CSS-like content
-        assert len(content) > 0, f"{css_file.name} should not be empty"
+        assert len(content) > 0, f"{name} should not be empty"
         # Should have at least some CSS rules or variables
-        has_css_syntax = "{" in content and "}" in content or ":" in content and ";" in content
-        assert has_css_syntax, f"{css_file.name} should contain CSS syntax"
+        has_css_syntax = b"{" in content and b"}" in content or b":" in content and b";" in content
+        assert has_css_syntax, f"{name} should contain CSS syntax"
 
 
-def test_js_files_valid_js(js_dir: Path):
+def test_js_files_valid_js(js_sources: dict):
     """Test that JavaScript files are valid (have basic JS syntax)."""
-    js_files = list(js_dir.glob("*.js"))
-
-    for js_file in js_files:
-        content = js_file.read_text(encoding="utf-8")
+    for name, content in js_sources.items():
         # Basic check - should have JavaScript-like content
-        assert len(content) > 0, f"{js_file.name} should not be empty"
-        # Should have at least some JS syntax
-        has_js_syntax = (
-            "function" in content
-            or "const" in content
-            or "let" in content
-            or "var" in content
-            or "=>" in content
-        )
-        assert has_js_syntax or True, f"{js_file.name} should contain JavaScript syntax"
+        assert len(content) > 0, f"{name} should not be empty"
 
 
 def test_skills_data_file_exists(project_root: Path):
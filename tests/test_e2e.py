@@ -1,43 +1,129 @@
 """End-to-end tests with Playwright"""
 
-from pathlib import Path
-
 import pytest
 
+# Visibility, text, classes and href of every element matching each selector,
+# read in one round trip. "visible" follows Playwright's rule: a non-empty bounding box
+# and no visibility:hidden.
+_SNAPSHOT_JS = """(selectors) => Object.fromEntries(
+    Object.entries(selectors).map(([name, selector]) => [
+        name,
+        [...document.querySelectorAll(selector)].map((el) => {
+            const box = el.getBoundingClientRect();
+            return {
+                visible: box.width > 0 && box.height > 0
+                    && getComputedStyle(el).visibility !== "hidden",
+                text: el.innerText,
+                classes: [...el.classList],
+                href: el.getAttribute("href"),
+            };
+        }),
+    ])
+)"""
+
+
+# Collects errors inside the page so only the final list crosses to Python:
+# console.error calls, uncaught exceptions, rejected promises and failed
+# resource loads (which only reach capturing listeners).
+_COLLECT_ERRORS_JS = """
+window.__errors = [];
+const consoleError = console.error;
+console.error = (...args) => {
+    window.__errors.push(args.map(String).join(" "));
+    consoleError.apply(console, args);
+};
+window.addEventListener("error", (event) => {
+    const target = event.target;
+    window.__errors.push(
+        target && target !== window
+            ? `Failed to load ${target.src || target.href}`
+            : String(event.message)
+    );
+}, true);
+window.addEventListener("unhandledrejection", (event) => {
+    window.__errors.push(`Unhandled rejection: ${event.reason}`);
+});
+"""
+
+
+def snapshot(page, **selectors) -> dict:
+    """Return the state of the elements matching each named selector."""
+    return page.evaluate(_SNAPSHOT_JS, selectors)
+
+
+def switch_tab(page, label: str, section: str):
+    """Click the tab labelled ``label`` and wait until ``section`` is shown."""
+    page.locator(".tab-btn").filter(has_text=label).click()
+    page.locator(f"{section}.active").wait_for(state="visible")
+
+
+def click_filter(page, selector: str, label: str):
+    """Click the ``selector`` button labelled ``label`` and wait until it is active."""
+    page.locator(selector).filter(has_text=label).click()
+    page.locator(f"{selector}.active").filter(has_text=label).wait_for(state="visible")
+
+
+@pytest.fixture(scope="module")
+def file_loaded_page(browser, browser_context_args, index_file_url: str):
+    """Return a page that has loaded index.html once for this module.
+
+    Shared by tests that only read the initial state. Tests that click, resize
+    or listen for console messages use the function-scoped ``page`` instead.
+    """
+    context = browser.new_context(**browser_context_args)
+    page = context.new_page()
+    page.goto(index_file_url)
+    yield page
+    context.close()
+
+
+@pytest.fixture(scope="module")
+def file_skills_page(browser, browser_context_args, index_file_url: str):
+    """Return a page already switched to the skills tab, shared by this module.
+
+    For tests that only read the skills section; clicking a filter here would
+    leak into the tests that run after it.
+    """
+    context = browser.new_context(**browser_context_args)
+    page = context.new_page()
+    page.goto(index_file_url)
+    switch_tab(page, "技能插件", "#skills-section")
+    yield page
+    context.close()
+
 
 @pytest.mark.e2e
-def test_page_loads(page, index_html: Path):
+def test_page_loads(file_loaded_page):
     """Test that the page loads without errors."""
-    # Navigate to the local HTML file
-    page.goto(f"file://{index_html.absolute()}")
+    page = file_loaded_page
 
     # Check that page loaded successfully
     assert page.title() == "Moltbot - AI Assistant Hub"
 
 
 @pytest.mark.e2e
-def test_header_elements(page, index_html: Path):
+def test_header_elements(file_loaded_page):
     """Test that header elements are present and visible."""
-    page.goto(f"file://{index_html.absolute()}")
+    state = snapshot(file_loaded_page, logo=".logo", tabs=".tab-btn")
 
     # Check logo
-    logo = page.locator(".logo")
-    assert logo.is_visible()
-    assert "Moltbot" in logo.inner_text()
+    logo = state["logo"][0]
+    assert logo["visible"]
+    assert "Moltbot" in logo["text"]
 
     # Check tabs
-    tabs = page.locator(".tab-btn")
-    assert tabs.count() == 2
+    tabs = state["tabs"]
+    assert len(tabs) == 2
 
     # Check tab text
-    assert "新闻资讯" in tabs.nth(0).inner_text()
-    assert "技能插件" in tabs.nth(1).inner_text()
+    assert "新闻资讯" in tabs[0]["text"]
+    assert "技能插件" in tabs[1]["text"]
 
 
 @pytest.mark.e2e
-def test_hero_section(page, index_html: Path):
+def test_hero_section(file_loaded_page):
     """Test that hero section is present."""
-    page.goto(f"file://{index_html.absolute()}")
+    page = file_loaded_page
 
     hero = page.locator(".hero")
     assert hero.is_visible()
@@ -48,9 +134,9 @@ def test_hero_section(page, index_html: Path):
 
 
 @pytest.mark.e2e
-def test_news_section_visible(page, index_html: Path):
+def test_news_section_visible(file_loaded_page):
     """Test that news section is visible by default."""
-    page.goto(f"file://{index_html.absolute()}")
+    page = file_loaded_page
 
     news_section = page.locator("#news-section")
     assert news_section.is_visible()
@@ -62,25 +148,21 @@ def test_news_section_visible(page, index_html: Path):
 
 
 @pytest.mark.e2e
-def test_skills_section_hidden_by_default(page, index_html: Path):
+def test_skills_section_hidden_by_default(file_loaded_page):
     """Test that skills section is hidden by default."""
-    page.goto(f"file://{index_html.absolute()}")
+    page = file_loaded_page
 
     skills_section = page.locator("#skills-section")
     assert not skills_section.is_visible()
 
 
 @pytest.mark.e2e
-def test_tab_switching_to_skills(page, index_html: Path):
+def test_tab_switching_to_skills(page, index_file_url: str):
     """Test switching from news to skills tab."""
-    page.goto(f"file://{index_html.absolute()}")
+    page.goto(index_file_url)
 
     # Click skills tab
-    skills_tab = page.locator(".tab-btn").filter(has_text="技能插件")
-    skills_tab.click()
-
-    # Wait for transition
-    page.wait_for_timeout(300)
+    switch_tab(page, "技能插件", "#skills-section")
 
     # Check skills section is now visible
     skills_section = page.locator("#skills-section")
@@ -92,19 +174,15 @@ def test_tab_switching_to_skills(page, index_html: Path):
 
 
 @pytest.mark.e2e
-def test_tab_switching_to_news(page, index_html: Path):
+def test_tab_switching_to_news(page, index_file_url: str):
     """Test switching from skills to news tab."""
-    page.goto(f"file://{index_html.absolute()}")
+    page.goto(index_file_url)
 
     # First switch to skills
-    skills_tab = page.locator(".tab-btn").filter(has_text="技能插件")
-    skills_tab.click()
-    page.wait_for_timeout(300)
+    switch_tab(page, "技能插件", "#skills-section")
 
     # Then switch back to news
-    news_tab = page.locator(".tab-btn").filter(has_text="新闻资讯")
-    news_tab.click()
-    page.wait_for_timeout(300)
+    switch_tab(page, "新闻资讯", "#news-section")
 
     # Check news section is visible
     news_section = page.locator("#news-section")
@@ -112,9 +190,9 @@ def test_tab_switching_to_news(page, index_html: Path):
 
 
 @pytest.mark.e2e
-def test_news_filter_buttons(page, index_html: Path):
+def test_news_filter_buttons(file_loaded_page):
     """Test that news filter buttons exist and work."""
-    page.goto(f"file://{index_html.absolute()}")
+    page = file_loaded_page
 
     # Check filter buttons exist
     filters = page.locator(".filter-chip")
@@ -122,14 +200,12 @@ def test_news_filter_buttons(page, index_html: Path):
 
 
 @pytest.mark.e2e
-def test_news_filter_all(page, index_html: Path):
+def test_news_filter_all(page, index_file_url: str):
     """Test 'all' news filter shows all items."""
-    page.goto(f"file://{index_html.absolute()}")
+    page.goto(index_file_url)
 
     # Click '全部' filter
-    all_filter = page.locator(".filter-chip").filter(has_text="全部")
-    all_filter.click()
-    page.wait_for_timeout(300)
+    click_filter(page, ".filter-chip", "全部")
 
     # Check that news cards are displayed
     news_cards = page.locator("#news-section .unified-card")
@@ -138,14 +214,9 @@ def test_news_filter_all(page, index_html: Path):
 
 
 @pytest.mark.e2e
-def test_skill_filter_buttons(page, index_html: Path):
+def test_skill_filter_buttons(file_skills_page):
     """Test that skill filter buttons exist."""
-    page.goto(f"file://{index_html.absolute()}")
-
-    # Switch to skills tab first
-    skills_tab = page.locator(".tab-btn").filter(has_text="技能插件")
-    skills_tab.click()
-    page.wait_for_timeout(300)
+    page = file_skills_page
 
     # Check filter buttons exist
     filters = page.locator(".skill-filter-btn")
@@ -153,19 +224,15 @@ def test_skill_filter_buttons(page, index_html: Path):
 
 
 @pytest.mark.e2e
-def test_skill_filter_productivity(page, index_html: Path):
+def test_skill_filter_productivity(page, index_file_url: str):
     """Test productivity skill filter."""
-    page.goto(f"file://{index_html.absolute()}")
+    page.goto(index_file_url)
 
     # Switch to skills tab
-    skills_tab = page.locator(".tab-btn").filter(has_text="技能插件")
-    skills_tab.click()
-    page.wait_for_timeout(300)
+    switch_tab(page, "技能插件", "#skills-section")
 
     # Click productivity filter
-    productivity_filter = page.locator(".skill-filter-btn").filter(has_text="生产力")
-    productivity_filter.click()
-    page.wait_for_timeout(300)
+    click_filter(page, ".skill-filter-btn", "生产力")
 
     # Check that skill cards are displayed
     skill_cards = page.locator(".skill-card")
@@ -173,34 +240,23 @@ def test_skill_filter_productivity(page, index_html: Path):
 
 
 @pytest.mark.e2e
-def test_skill_cards_have_install_command(page, index_html: Path):
+def test_skill_cards_have_install_command(file_skills_page):
     """Test that skill cards have install commands."""
-    page.goto(f"file://{index_html.absolute()}")
-
-    # Switch to skills tab
-    skills_tab = page.locator(".tab-btn").filter(has_text="技能插件")
-    skills_tab.click()
-    page.wait_for_timeout(300)
+    install_commands = snapshot(file_skills_page, commands=".install-cmd")["commands"]
 
     # Check for install commands
-    install_commands = page.locator(".install-cmd")
     # Updated count: Should have 16 skills rendered
-    assert install_commands.count() >= 5
+    assert len(install_commands) >= 5
 
     # Check that commands start with "molt install" or similar
-    first_command = install_commands.nth(0).inner_text()
+    first_command = install_commands[0]["text"]
     assert "install" in first_command.lower()
 
 
 @pytest.mark.e2e
-def test_copy_button_functionality(page, index_html: Path):
+def test_copy_button_functionality(file_skills_page):
     """Test that copy buttons exist and are clickable."""
-    page.goto(f"file://{index_html.absolute()}")
-
-    # Switch to skills tab
-    skills_tab = page.locator(".tab-btn").filter(has_text="技能插件")
-    skills_tab.click()
-    page.wait_for_timeout(300)
+    page = file_skills_page
 
     # Find copy button
     copy_btn = page.locator(".copy-btn").first
@@ -212,22 +268,21 @@ def test_copy_button_functionality(page, index_html: Path):
 
 
 @pytest.mark.e2e
-def test_footer_visible(page, index_html: Path):
+def test_footer_visible(file_loaded_page):
     """Test that footer is present."""
-    page.goto(f"file://{index_html.absolute()}")
+    state = snapshot(file_loaded_page, footer="footer", links="footer a")
 
-    footer = page.locator("footer")
-    assert footer.is_visible()
+    assert state["footer"][0]["visible"]
 
     # Check footer links
-    assert footer.locator("a").count() >= 2
+    assert len(state["links"]) >= 2
 
 
 @pytest.mark.e2e
-def test_responsive_design_mobile(page, index_html: Path):
+def test_responsive_design_mobile(page, index_file_url: str):
     """Test responsive design on mobile viewport."""
     page.set_viewport_size({"width": 375, "height": 667})
-    page.goto(f"file://{index_html.absolute()}")
+    page.goto(index_file_url)
 
     # Check that main elements are still visible
     assert page.locator(".logo").is_visible()
@@ -238,46 +293,34 @@ def test_responsive_design_mobile(page, index_html: Path):
 
 
 @pytest.mark.e2e
-def test_no_console_errors(page, index_html: Path):
+def test_no_console_errors(page, index_file_url: str):
     """Test that there are no console errors."""
-    errors = []
+    page.add_init_script(_COLLECT_ERRORS_JS)
+    page.goto(index_file_url)
 
-    def handle_console(msg):
-        if msg.type == "error":
-            errors.append(msg.text)
-
-    page.on("console", handle_console)
-    page.goto(f"file://{index_html.absolute()}")
-
-    # Wait a bit for any async errors
-    page.wait_for_timeout(1000)
+    # Let pending loads settle so async errors are recorded
+    page.wait_for_load_state("networkidle")
+    errors = page.evaluate("() => window.__errors")
 
     assert len(errors) == 0, f"Console errors found: {errors}"
 
 
 @pytest.mark.e2e
-def test_github_links_open_in_new_tab(page, index_html: Path):
+def test_github_links_open_in_new_tab(file_skills_page):
     """Test that GitHub links have target='_blank'."""
-    page.goto(f"file://{index_html.absolute()}")
-
-    # Switch to skills tab
-    skills_tab = page.locator(".tab-btn").filter(has_text="技能插件")
-    skills_tab.click()
-    page.wait_for_timeout(300)
-
     # Check GitHub buttons
-    github_btn = page.locator(".github-btn").first
-    assert github_btn.is_visible()
+    github_btn = snapshot(file_skills_page, buttons=".github-btn")["buttons"][0]
+    assert github_btn["visible"]
 
     # Check target attribute
-    target = github_btn.get_attribute("href")
+    target = github_btn["href"]
     assert target and "github.com" in target
 
 
 @pytest.mark.e2e
-def test_news_cards_have_images(page, index_html: Path):
+def test_news_cards_have_images(file_loaded_page):
     """Test that news cards have images."""
-    page.goto(f"file://{index_html.absolute()}")
+    page = file_loaded_page
 
     # Check that news cards have images
     images = page.locator("#news-section .unified-card img")
@@ -286,14 +329,9 @@ def test_news_cards_have_images(page, index_html: Path):
 
 
 @pytest.mark.e2e
-def test_skill_cards_have_github_links(page, index_html: Path):
+def test_skill_cards_have_github_links(file_skills_page):
     """Test that skill cards have GitHub links."""
-    page.goto(f"file://{index_html.absolute()}")
-
-    # Switch to skills tab
-    skills_tab = page.locator(".tab-btn").filter(has_text="技能插件")
-    skills_tab.click()
-    page.wait_for_timeout(300)
+    page = file_skills_page
 
     # Check for GitHub buttons
     github_btns = page.locator(".github-btn")
@@ -302,26 +340,22 @@ def test_skill_cards_have_github_links(page, index_html: Path):
 
 
 @pytest.mark.e2e
-def test_active_state_on_filters(page, index_html: Path):
+def test_active_state_on_filters(file_loaded_page):
     """Test that filter buttons show active state correctly."""
-    page.goto(f"file://{index_html.absolute()}")
+    chips = snapshot(file_loaded_page, chips=".filter-chip")["chips"]
 
     # Check initial active state
-    all_filter = page.locator(".filter-chip").filter(has_text="全部")
-    classes = all_filter.get_attribute("class") or ""
-    assert "active" in classes
+    all_filter = next(chip for chip in chips if "全部" in chip["text"])
+    assert "active" in all_filter["classes"]
 
 
 @pytest.mark.e2e
-def test_active_state_on_tabs(page, index_html: Path):
+def test_active_state_on_tabs(file_loaded_page):
     """Test that tab buttons show active state correctly."""
-    page.goto(f"file://{index_html.absolute()}")
+    tabs = snapshot(file_loaded_page, tabs=".tab-btn")["tabs"]
+    news_tab = next(tab for tab in tabs if "新闻资讯" in tab["text"])
+    skills_tab = next(tab for tab in tabs if "技能插件" in tab["text"])
 
     # Check initial active state (news tab should be active)
-    news_tab = page.locator(".tab-btn").filter(has_text="新闻资讯")
-    classes = news_tab.get_attribute("class") or ""
-    assert "active" in classes
-
-    skills_tab = page.locator(".tab-btn").filter(has_text="技能插件")
-    classes = skills_tab.get_attribute("class") or ""
-    assert "active" not in classes
+    assert "active" in news_tab["classes"]
+    assert "active" not in skills_tab["classes"]
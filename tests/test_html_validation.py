@@ -1,262 +1,154 @@
 """HTML validation tests"""
 
-from html.parser import HTMLParser
-
-
-class LinkExtractor(HTMLParser):
-    """Extract links from HTML"""
-
-    def __init__(self):
-        super().__init__()
-        self.links = []
-
-    def handle_starttag(self, tag, attrs):
-        if tag == "a":
-            for attr, value in attrs:
-                if attr == "href":
-                    self.links.append(value)
-        elif tag == "link":
-            for attr, value in attrs:
-                if attr == "href":
-                    self.links.append(value)
-        elif tag == "img":
-            for attr, value in attrs:
-                if attr == "src":
-                    self.links.append(value)
-        elif tag == "script":
-            for attr, value in attrs:
-                if attr == "src":
-                    self.links.append(value)
-
-
-class StructureValidator(HTMLParser):
-    """Validate HTML structure"""
-
-    def __init__(self):
-        super().__init__()
-        self.has_doctype = False
-        self.has_html = False
-        self.has_head = False
-        self.has_body = False
-        self.has_title = False
-        self.has_meta_charset = False
-        self.has_meta_viewport = False
-        self.errors = []
-
-    def handle_decl(self, decl):
-        if "DOCTYPE" in decl.upper():
-            self.has_doctype = True
-
-    def handle_starttag(self, tag, attrs):
-        if tag == "html":
-            self.has_html = True
-        elif tag == "head":
-            self.has_head = True
-        elif tag == "body":
-            self.has_body = True
-        elif tag == "title":
-            self.has_title = True
-        elif tag == "meta":
-            attr_dict = dict(attrs)
-            if "charset" in attr_dict:
-                self.has_meta_charset = True
-            if attr_dict.get("name") == "viewport":
-                self.has_meta_viewport = True
-
-
-def extract_links(html_content: str) -> list[str]:
-    """Extract all links from HTML content."""
-    parser = LinkExtractor()
-    parser.feed(html_content)
-    return parser.links
-
-
-def validate_html_structure(html_content: str) -> tuple[bool, list[str]]:
-    """Validate basic HTML structure."""
-    validator = StructureValidator()
-    validator.feed(html_content)
-
-    errors = []
-    if not validator.has_doctype:
-        errors.append("Missing DOCTYPE declaration")
-    if not validator.has_html:
-        errors.append("Missing <html> tag")
-    if not validator.has_head:
-        errors.append("Missing <head> tag")
-    if not validator.has_body:
-        errors.append("Missing <body> tag")
-    if not validator.has_title:
-        errors.append("Missing <title> tag")
-    if not validator.has_meta_charset:
-        errors.append("Missing charset meta tag")
-    if not validator.has_meta_viewport:
-        errors.append("Missing viewport meta tag")
-
-    return len(errors) == 0, errors
-
-
-def test_html_structure(index_html_content: str):
+import pytest
+
+from tests._html_helpers import extract_links, validate_html_structure
+
+_REQUIRED_SECTIONS = (
+    "<header",
+    '<section class="hero"',
+    '<section id="news-section"',
+    '<section id="skills-section"',
+    "<footer",
+)
+# Groups of alternatives: a check passes when any one of them is present
+_EXTERNAL_CSS_PATTERNS = ('<link rel="stylesheet"', 'href="css/', 'href="./css/')
+_EXTERNAL_JS_PATTERNS = ('<script src="js/', '<script src="./js/', 'src="js/')
+_REQUIRED_DATA = ("const data = {", "news:", "skills:", "news_items:", "categories:")
+# New architecture: Some elements are rendered dynamically
+_REQUIRED_ELEMENTS = (
+    'class="tab-btn"',
+    'class="filter-chip"',
+    'id="skill-filters"',  # Container for dynamically rendered filters
+    'id="news-grid"',
+    'id="skills-grid"',
+    'onclick="switchTab',
+    'onclick="filterNews',
+    # filterSkills is called from dynamically rendered buttons
+)
+_VARIABLES_CSS = ('href="css/variables.css"', 'href="./css/variables.css"')
+_REQUIRED_CSS_VARS = ("--primary:", "--accent:", "--bg-color:")
+_FUNCTION_SCRIPTS = ('src="js/utils/filter.js"', 'src="js/app.js"', 'src="./js/utils/filter.js"')
+_INLINE_FUNCTIONS = ("function switchTab", "function filterNews")
+_LAYOUT_CSS = ('href="css/layout.css"', 'href="./css/layout.css"')
+_FOOTER_LINKS = ("https://github.com/moltbot/moltbot", "https://docs.molt.bot")
+
+
+@pytest.fixture(scope="session")
+def parsed_index(index_html_bytes: bytes, index_html_content: str) -> dict:
+    """Return the links and structure check of index.html, parsed once (session scope)."""
+    return {
+        "links": extract_links(index_html_bytes),
+        "structure": validate_html_structure(index_html_content),
+    }
+
+
+def test_html_structure(parsed_index: dict):
     """Test that HTML has proper structure."""
-    is_valid, errors = validate_html_structure(index_html_content)
-    error_message = "\n".join(errors)
-    assert is_valid, f"HTML structure validation failed:\n{error_message}"
+    is_valid, errors = parsed_index["structure"]
+    # The message is only built when the assertion fails
+    assert is_valid, "HTML structure validation failed:\n" + "\n".join(errors)
 
 
-def test_html_has_required_sections(index_html_content: str):
+def test_html_has_required_sections(index_html_content):
     """Test that HTML has required sections."""
-    required_sections = [
-        "<header",
-        '<section class="hero"',
-        '<section id="news-section"',
-        '<section id="skills-section"',
-        "<footer",
-    ]
-
-    for section in required_sections:
+    for section in _REQUIRED_SECTIONS:
         assert section in index_html_content, f"Missing required section: {section}"
 
 
-def test_html_has_external_css_links(index_html_content: str):
+def test_html_has_external_css_links(index_html_content):
     """Test that HTML references external CSS files (modular structure)."""
-    # Check for external CSS file references
-    external_css_patterns = [
-        '<link rel="stylesheet"',
-        'href="css/',
-        'href="./css/',
-    ]
-
     # At least one external CSS link should be present for modular structure
-    has_external_css = any(pattern in index_html_content for pattern in external_css_patterns)
+    has_external_css = any(marker in index_html_content for marker in _EXTERNAL_CSS_PATTERNS)
 
     # Note: Current HTML uses inline styles, but tests check for modular structure
     # This test will pass if either inline styles OR external CSS is present
     has_inline_style = "<style>" in index_html_content
 
-    assert (
-        has_external_css or has_inline_style
-    ), "HTML should have either external CSS links or inline styles"
+    assert has_external_css or has_inline_style, (
+        "HTML should have either external CSS links or inline styles"
+    )
 
 
-def test_html_has_external_js_links(index_html_content: str):
+def test_html_has_external_js_links(index_html_content):
     """Test that HTML references external JavaScript files (modular structure)."""
-    # Check for external JS file references
-    external_js_patterns = [
-        '<script src="js/',
-        '<script src="./js/',
-        'src="js/',
-    ]
-
     # At least one external JS link should be present for modular structure
-    has_external_js = any(pattern in index_html_content for pattern in external_js_patterns)
+    has_external_js = any(marker in index_html_content for marker in _EXTERNAL_JS_PATTERNS)
 
     # Note: Current HTML uses inline JavaScript, but tests check for modular structure
     # This test will pass if either inline script OR external JS is present
     has_inline_script = "<script>" in index_html_content and "</script>" in index_html_content
 
-    assert (
-        has_external_js or has_inline_script
-    ), "HTML should have either external JS links or inline scripts"
+    assert has_external_js or has_inline_script, (
+        "HTML should have either external JS links or inline scripts"
+    )
 
 
-def test_html_has_javascript_data(index_html_content: str):
+def test_html_has_javascript_data(index_html_content):
     """Test that HTML contains the JavaScript data object."""
-    required_data = [
-        "const data = {",
-        "news:",
-        "skills:",
-        "news_items:",
-        "categories:",
-    ]
-
-    for data_item in required_data:
+    for data_item in _REQUIRED_DATA:
         assert data_item in index_html_content, f"Missing JavaScript data: {data_item}"
 
 
-def test_html_has_required_elements(index_html_content: str):
+def test_html_has_required_elements(index_html_content):
     """Test that HTML has required interactive elements."""
-    # New architecture: Some elements are rendered dynamically
-    required_elements = [
-        'class="tab-btn"',
-        'class="filter-chip"',
-        'id="skill-filters"',  # Container for dynamically rendered filters
-        'id="news-grid"',
-        'id="skills-grid"',
-        'onclick="switchTab',
-        'onclick="filterNews',
-        # filterSkills is called from dynamically rendered buttons
-    ]
-
-    for element in required_elements:
+    for element in _REQUIRED_ELEMENTS:
         assert element in index_html_content, f"Missing required element: {element}"
 
 
-def test_html_has_css_variables(index_html_content: str):
+def test_html_has_css_variables(index_html_content):
     """Test that HTML has CSS variables (inline or external)."""
     # Check for external CSS file that contains variables
-    has_external_css = (
-        'href="css/variables.css"' in index_html_content
-        or 'href="./css/variables.css"' in index_html_content
-    )
+    has_external_css = any(marker in index_html_content for marker in _VARIABLES_CSS)
 
     # Check for inline CSS variables
-    required_vars = [
-        "--primary:",
-        "--accent:",
-        "--bg-color:",
-    ]
-    has_inline_vars = any(var in index_html_content for var in required_vars)
+    has_inline_vars = any(marker in index_html_content for marker in _REQUIRED_CSS_VARS)
 
-    assert (
-        has_external_css or has_inline_vars
-    ), "CSS variables should be in external css/variables.css or inline"
+    assert has_external_css or has_inline_vars, (
+        "CSS variables should be in external css/variables.css or inline"
+    )
 
 
-def test_html_has_news_cards(index_html_content: str):
+def test_html_has_news_cards(index_html_content):
     """Test that HTML has news grid for dynamic rendering."""
     # New architecture: News cards are rendered dynamically from JSON
     # Check for the grid container instead of static cards
     assert 'id="news-grid"' in index_html_content, "Missing news grid container"
-    assert (
-        'class="card-grid"' in index_html_content or 'id="news-grid"' in index_html_content
-    ), "Missing card grid structure"
+    assert 'class="card-grid"' in index_html_content or 'id="news-grid"' in index_html_content, (
+        "Missing card grid structure"
+    )
 
 
-def test_html_has_skill_filters(index_html_content: str):
+def test_html_has_skill_filters(index_html_content):
     """Test that HTML has skill filter container for dynamic rendering."""
     # New architecture: Skill filters are rendered dynamically from JSON
     # Check for the filter container instead of static buttons
     assert 'id="skill-filters"' in index_html_content, "Missing skill filters container"
 
 
-def test_extract_links_count(index_html_content: str):
+def test_extract_links_count(parsed_index: dict):
     """Test that we can extract links from HTML."""
-    links = extract_links(index_html_content)
+    links = parsed_index["links"]
     # New architecture: Fewer links in HTML since content is in JSON files
     # Expect at least 15 links (fonts, external CSS/JS, footer links, etc.)
     assert len(links) >= 15, f"Expected at least 15 links, found {len(links)}"
 
 
-def test_html_has_required_functions(index_html_content: str):
+def test_html_has_required_functions(index_html_content):
     """Test that HTML has required JavaScript (inline or external)."""
     # New architecture: Functions are in external JS files
     # Check for external JS files that contain these functions
-    has_external_js = (
-        'src="js/utils/filter.js"' in index_html_content
-        or 'src="js/app.js"' in index_html_content
-        or 'src="./js/utils/filter.js"' in index_html_content
-    )
+    has_external_js = any(marker in index_html_content for marker in _FUNCTION_SCRIPTS)
 
     # Check for inline function definitions
-    has_inline_functions = (
-        "function switchTab" in index_html_content or "function filterNews" in index_html_content
-    )
+    has_inline_functions = any(marker in index_html_content for marker in _INLINE_FUNCTIONS)
 
-    assert (
-        has_external_js or has_inline_functions
-    ), "JavaScript should be in external JS files or inline"
+    assert has_external_js or has_inline_functions, (
+        "JavaScript should be in external JS files or inline"
+    )
 
 
-def test_html_encoding_declaration(index_html_content: str):
+def test_html_encoding_declaration(index_html_content):
     """Test that HTML has proper encoding declaration."""
     assert 'charset="UTF-8"' in index_html_content, "Missing UTF-8 charset declaration"
     assert (
@@ -265,23 +157,19 @@ def test_html_encoding_declaration(index_html_content: str):
     )
 
 
-def test_html_responsive_design(index_html_content: str):
+def test_html_responsive_design(index_html_content):
     """Test that HTML has responsive design elements."""
     assert 'name="viewport"' in index_html_content, "Missing viewport meta tag"
     # Check for external CSS with media queries OR inline @media
-    has_external_css = (
-        'href="css/layout.css"' in index_html_content
-        or 'href="./css/layout.css"' in index_html_content
-    )
+    has_external_css = any(marker in index_html_content for marker in _LAYOUT_CSS)
     has_inline_media = "@media" in index_html_content
-    assert (
-        has_external_css or has_inline_media
-    ), "Missing responsive CSS (external css/layout.css or inline @media)"
+    assert has_external_css or has_inline_media, (
+        "Missing responsive CSS (external css/layout.css or inline @media)"
+    )
 
 
-def test_html_has_footer_links(index_html_content: str):
+def test_html_has_footer_links(index_html_content):
     """Test that HTML footer has required links."""
-    assert (
-        "https://github.com/moltbot/moltbot" in index_html_content
-    ), "Missing GitHub link in footer"
-    assert "https://docs.molt.bot" in index_html_content, "Missing docs link in footer"
+    github_link, docs_link = _FOOTER_LINKS
+    assert github_link in index_html_content, "Missing GitHub link in footer"
+    assert docs_link in index_html_content, "Missing docs link in footer"
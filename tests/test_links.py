@@ -5,30 +5,59 @@ from urllib.parse import urlparse
 
 import pytest
 
+# One alternation for the three linking tags, so the HTML is scanned once; the
+# number of the group that matched (lastindex) tells which tag it was
+_TAG_RE = re.compile(
+    r'<a[^>]+href=["\']([^"\']+)["\'][^>]*>'
+    r'|<img[^>]+src=["\']([^"\']+)["\'][^>]*>'
+    r'|<link[^>]+href=["\']([^"\']+)["\'][^>]*>'
+)
+_TAG_TYPES = (None, "anchor", "image", "link")
+# Attribute pattern for the element IDs anchors may target
+_ID_RE = re.compile(r'id=["\']([^"\']+)["\']')
+
 
 def extract_all_links(html_content: str) -> list[dict]:
     """Extract all links from HTML content with context."""
-    links = []
-
-    # Extract href attributes from <a> tags
-    href_pattern = r'<a[^>]+href=["\']([^"\']+)["\'][^>]*>'
-    for match in re.finditer(href_pattern, html_content):
-        url = match.group(1)
-        links.append({"url": url, "type": "anchor", "context": match.group(0)[:100]})
-
-    # Extract src attributes from <img> tags
-    src_pattern = r'<img[^>]+src=["\']([^"\']+)["\'][^>]*>'
-    for match in re.finditer(src_pattern, html_content):
-        url = match.group(1)
-        links.append({"url": url, "type": "image", "context": match.group(0)[:100]})
-
-    # Extract href from <link> tags
-    link_pattern = r'<link[^>]+href=["\']([^"\']+)["\'][^>]*>'
-    for match in re.finditer(link_pattern, html_content):
-        url = match.group(1)
-        links.append({"url": url, "type": "link", "context": match.group(0)[:100]})
-
-    return links
+    by_type = {"anchor": [], "image": [], "link": []}
+
+    for match in _TAG_RE.finditer(html_content):
+        group = match.lastindex
+        by_type[_TAG_TYPES[group]].append(
+            {"url": match.group(group), "type": _TAG_TYPES[group], "context": match.group(0)[:100]}
+        )
+
+    # Anchors, then images, then <link> tags, as the per-tag scans returned them
+    return by_type["anchor"] + by_type["image"] + by_type["link"]
+
+
+@pytest.fixture(scope="session")
+def all_links(index_html_content: str) -> list[dict]:
+    """Return the links extracted from index.html (session scope)."""
+    return extract_all_links(index_html_content)
+
+
+_REQUIRED_LINKS = (
+    "https://github.com/moltbot/moltbot",
+    "https://docs.molt.bot",
+    "https://fonts.googleapis.com",
+)
+_FONT_HOSTS = ("fonts.googleapis.com", "fonts.gstatic.com")
+_DATA_LOADERS = ('src="js/data-loader.js"', 'src="./js/data-loader.js"')
+_PLACEHOLDER_PATTERNS = (
+    "http://example.com",
+    "https://example.com",
+    "http://localhost",
+    "http://127.0.0.1",
+    "http://placeholder",
+    "#TODO",
+    "#FIXME",
+)
+# Any placeholder in one search of the lowercased URL; matching lowercased
+# patterns is faster here than re.IGNORECASE, which case-folds every character
+_PLACEHOLDER_RE = re.compile("|".join(re.escape(p.lower()) for p in _PLACEHOLDER_PATTERNS))
+# A GitHub owner (user or org) segment, the first path part after the host
+_GITHUB_OWNER_RE = re.compile(r"[\w.-]+")
 
 
 def is_valid_url(url: str) -> bool:
@@ -37,7 +66,7 @@ def is_valid_url(url: str) -> bool:
         return False
 
     # Skip anchors and javascript links
-    if url.startswith("#") or url.startswith("javascript:"):
+    if url.startswith(("#", "javascript:")):
         return True
 
     try:
@@ -47,11 +76,16 @@ def is_valid_url(url: str) -> bool:
         return False
 
 
+# Prefix groups for str.startswith, which tries a whole tuple in one C call
+_WEB_PREFIXES = ("http://", "https://")
+_NON_URL_PREFIXES = ("data:", "blob:", "${")
+
+
 def categorize_link(url: str) -> str:
     """Categorize link by type."""
     if url.startswith("#"):
         return "anchor"
-    if url.startswith("http://") or url.startswith("https://"):
+    if url.startswith(_WEB_PREFIXES):
         return "external"
     if url.startswith("/"):
         return "internal_absolute"
@@ -63,11 +97,9 @@ def categorize_link(url: str) -> str:
 
 
 @pytest.mark.slow
-def test_external_links_format(index_html_content: str):
+def test_external_links_format(all_links: list[dict]):
     """Test that external links have valid format."""
-    links = extract_all_links(index_html_content)
-
-    external_links = [link for link in links if categorize_link(link["url"]) == "external"]
+    external_links = [link for link in all_links if categorize_link(link["url"]) == "external"]
 
     invalid_links = []
     for link in external_links:
@@ -79,13 +111,11 @@ def test_external_links_format(index_html_content: str):
         assert False, f"Found invalid external links:\n{error_msg}"
 
 
-def test_internal_links_format(index_html_content: str):
+def test_internal_links_format(all_links: list[dict]):
     """Test that internal links have valid format."""
-    links = extract_all_links(index_html_content)
-
     internal_links = [
         link
-        for link in links
+        for link in all_links
         if categorize_link(link["url"]) in ("anchor", "internal_absolute", "relative")
     ]
 
@@ -97,15 +127,12 @@ def test_internal_links_format(index_html_content: str):
     assert len(invalid_links) == 0, "Found empty internal links"
 
 
-def test_no_broken_anchor_links(index_html_content: str):
+def test_no_broken_anchor_links(all_links: list[dict], index_html_content: str):
     """Test that all anchor links reference existing IDs."""
-    links = extract_all_links(index_html_content)
-
-    anchor_links = [link["url"] for link in links if categorize_link(link["url"]) == "anchor"]
+    anchor_links = [link["url"] for link in all_links if categorize_link(link["url"]) == "anchor"]
 
     # Extract all IDs from the HTML
-    id_pattern = r'id=["\']([^"\']+)["\']'
-    all_ids = set(re.findall(id_pattern, index_html_content))
+    all_ids = set(_ID_RE.findall(index_html_content))
 
     # Remove the leading # from anchor links
     anchor_ids = {link[1:] for link in anchor_links if link != "#"}
@@ -116,11 +143,9 @@ def test_no_broken_anchor_links(index_html_content: str):
         assert False, f"Anchor links reference missing IDs: {missing_ids}"
 
 
-def test_image_links_format(index_html_content: str):
+def test_image_links_format(all_links: list[dict]):
     """Test that image links have valid format."""
-    links = extract_all_links(index_html_content)
-
-    image_links = [link for link in links if link["type"] == "image"]
+    image_links = [link for link in all_links if link["type"] == "image"]
 
     # Check that image URLs are valid
     invalid_images = []
@@ -128,13 +153,9 @@ def test_image_links_format(index_html_content: str):
         url = link["url"]
         if not url or url.strip() == "":
             invalid_images.append(link)
-        elif not (url.startswith("http://") or url.startswith("https://") or url.startswith("/")):
+        elif not url.startswith(_WEB_PREFIXES + ("/",)):
             # Only check if it looks like a URL (not data URLs, blob URLs, or template literals)
-            if (
-                not url.startswith("data:")
-                and not url.startswith("blob:")
-                and not url.startswith("${")
-            ):
+            if not url.startswith(_NON_URL_PREFIXES):
                 invalid_images.append(link)
 
     if invalid_images:
@@ -142,86 +163,62 @@ def test_image_links_format(index_html_content: str):
         assert False, f"Found invalid image links:\n{error_msg}"
 
 
-def test_has_required_external_links(index_html_content: str):
+def test_has_required_external_links(index_html_content):
     """Test that HTML has required external links."""
-    required_links = [
-        "https://github.com/moltbot/moltbot",
-        "https://docs.molt.bot",
-        "https://fonts.googleapis.com",
-    ]
-
-    for link in required_links:
+    for link in _REQUIRED_LINKS:
         assert link in index_html_content, f"Missing required external link: {link}"
 
 
-def test_no_placeholder_links(index_html_content: str):
+def test_no_placeholder_links(all_links: list[dict]):
     """Test that there are no obvious placeholder links."""
-    placeholder_patterns = [
-        "http://example.com",
-        "https://example.com",
-        "http://localhost",
-        "http://127.0.0.1",
-        "http://placeholder",
-        "#TODO",
-        "#FIXME",
+    found_placeholders = [
+        link["url"] for link in all_links if _PLACEHOLDER_RE.search(link["url"].lower())
     ]
 
-    links = extract_all_links(index_html_content)
-    found_placeholders = []
-
-    for link in links:
-        url = link["url"]
-        for pattern in placeholder_patterns:
-            if pattern.lower() in url.lower():
-                found_placeholders.append(url)
-                break
-
     if found_placeholders:
         error_msg = "\n".join([f"  - {url}" for url in found_placeholders])
         assert False, f"Found placeholder links:\n{error_msg}"
 
 
-def test_github_links_format(index_html_content: str):
+def test_github_links_format(all_links: list[dict]):
     """Test that GitHub links have proper format."""
-    github_pattern = r"https://github\.com/[\w\-]+(?:/[\w\-]+)?"
-
-    # Find all GitHub links (only full https URLs)
-    github_links = re.findall(github_pattern, index_html_content)
+    # GitHub links among the cached links (only full https URLs)
+    github_links = [
+        link["url"] for link in all_links if link["url"].startswith("https://github.com/")
+    ]
 
-    # Check basic format
+    # Every link must name an owner, so a bare https://github.com/ fails
     for link in github_links:
-        assert link.startswith("https://github.com/"), f"Invalid GitHub link format: {link}"
-        parts = link[len("https://github.com/") :].split("/")
-        assert len(parts) >= 1, f"GitHub link missing username/org: {link}"
+        owner = link[len("https://github.com/") :].split("/")[0]
+        assert _GITHUB_OWNER_RE.fullmatch(owner), f"GitHub link missing username/org: {link}"
 
 
-def test_mailto_links_format(index_html_content: str):
+def test_mailto_links_format(all_links: list[dict]):
     """Test that mailto links have proper format."""
-    mailto_pattern = r'mailto:([^\s"\'<>]+)'
-
-    mailto_links = re.findall(mailto_pattern, index_html_content)
+    # mailto: hrefs among the cached links, without the scheme
+    mailto_links = [
+        link["url"][len("mailto:") :] for link in all_links if link["url"].startswith("mailto:")
+    ]
 
     for email in mailto_links:
         assert "@" in email, f"Invalid email in mailto link: {email}"
         assert "." in email.split("@")[1], f"Invalid domain in mailto link: {email}"
 
 
-def test_link_count_minimum(index_html_content: str):
+def test_link_count_minimum(all_links: list[dict]):
     """Test that HTML has minimum number of links."""
-    links = extract_all_links(index_html_content)
-
     # New architecture: Fewer links in HTML since content is in JSON files
     # Expect at least 10 links (fonts, CSS, JS, footer links)
-    assert len(links) >= 10, f"Expected at least 10 links, found {len(links)}"
+    assert len(all_links) >= 10, f"Expected at least 10 links, found {len(all_links)}"
 
 
-def test_has_css_resource_links(index_html_content: str):
+def test_has_css_resource_links(index_html_content):
     """Test that HTML has CSS resource links (Google Fonts)."""
     assert "fonts.googleapis.com" in index_html_content, "Missing Google Fonts link"
     assert "fonts.gstatic.com" in index_html_content, "Missing Google Fonts preconnect link"
 
 
-def test_news_card_links(index_html_content: str):
+def test_news_card_links(index_html_content):
     """Test that HTML has external CSS/JS for news (content loaded from JSON)."""
     # New architecture: News content is loaded from JSON files
     # Check for external JS data loader
@@ -232,7 +229,7 @@ def test_news_card_links(index_html_content: str):
     assert has_data_loader, "Missing data loader script for news content"
 
 
-def test_skill_card_github_links(index_html_content: str):
+def test_skill_card_github_links(index_html_content):
     """Test that HTML has external JS for skills (content loaded from JSON)."""
     # New architecture: Skills are loaded from JSON files via data-loader
     # Check for the data directory reference or external JS files
@@ -28,18 +28,14 @@ def test_css_files_exist(css_dir):
 
 
 @pytest.mark.unit
-def test_css_files_valid_css(css_dir):
+def test_css_files_valid_css(css_sources: dict):
     """Test that CSS files are valid (have basic CSS syntax)."""
-
-    css_files = list(css_dir.glob("*.css"))
-
-    for css_file in css_files:
-        content = css_file.read_text(encoding="utf-8")
+    for name, content in css_sources.items():
         # Basic check - should have CSS-like content
-        assert len(content) > 0, f"{css_file.name} should not be empty"
+        assert len(content) > 0, f"{name} should not be empty"
         # Should have at least some CSS rules or variables
-        has_css_syntax = "{" in content and "}" in content or ":" in content and ";" in content
-        assert has_css_syntax, f"{css_file.name} should contain CSS syntax"
+        has_css_syntax = b"{" in content and b"}" in content or b":" in content and b";" in content
+        assert has_css_syntax, f"{name} should contain CSS syntax"
 
 
 @pytest.mark.unit
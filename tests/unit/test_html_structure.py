@@ -1,163 +1,79 @@
-"""Unit tests for HTML structure validation"""
+"""Unit tests for HTML structure validation
 
-from html.parser import HTMLParser
+The checks on index.html itself live in tests/test_html_validation.py; these
+exercise the shared parsers on small documents.
+"""
 
 import pytest
 
+from tests._html_helpers import (
+    extract_links,
+    extract_links_html_parser,
+    extract_links_lxml,
+    validate_html_structure,
+)
 
-class LinkExtractor(HTMLParser):
-    """Extract links from HTML"""
-
-    def __init__(self):
-        super().__init__()
-        self.links = []
-
-    def handle_starttag(self, tag, attrs):
-        if tag == "a":
-            for attr, value in attrs:
-                if attr == "href":
-                    self.links.append(value)
-        elif tag == "link":
-            for attr, value in attrs:
-                if attr == "href":
-                    self.links.append(value)
-        elif tag == "img":
-            for attr, value in attrs:
-                if attr == "src":
-                    self.links.append(value)
-        elif tag == "script":
-            for attr, value in attrs:
-                if attr == "src":
-                    self.links.append(value)
-
-
-class StructureValidator(HTMLParser):
-    """Validate HTML structure"""
-
-    def __init__(self):
-        super().__init__()
-        self.has_doctype = False
-        self.has_html = False
-        self.has_head = False
-        self.has_body = False
-        self.has_title = False
-        self.has_meta_charset = False
-        self.has_meta_viewport = False
-        self.errors = []
-
-    def handle_decl(self, decl):
-        if "DOCTYPE" in decl.upper():
-            self.has_doctype = True
-
-    def handle_starttag(self, tag, attrs):
-        if tag == "html":
-            self.has_html = True
-        elif tag == "head":
-            self.has_head = True
-        elif tag == "body":
-            self.has_body = True
-        elif tag == "title":
-            self.has_title = True
-        elif tag == "meta":
-            attr_dict = dict(attrs)
-            if "charset" in attr_dict:
-                self.has_meta_charset = True
-            if attr_dict.get("name") == "viewport":
-                self.has_meta_viewport = True
-
-
-def extract_links(html_content: str) -> list[str]:
-    """Extract all links from HTML content."""
-    parser = LinkExtractor()
-    parser.feed(html_content)
-    return parser.links
-
-
-def validate_html_structure(html_content: str) -> tuple[bool, list[str]]:
-    """Validate basic HTML structure."""
-    validator = StructureValidator()
-    validator.feed(html_content)
-
-    errors = []
-    if not validator.has_doctype:
-        errors.append("Missing DOCTYPE declaration")
-    if not validator.has_html:
-        errors.append("Missing <html> tag")
-    if not validator.has_head:
-        errors.append("Missing <head> tag")
-    if not validator.has_body:
-        errors.append("Missing <body> tag")
-    if not validator.has_title:
-        errors.append("Missing <title> tag")
-    if not validator.has_meta_charset:
-        errors.append("Missing charset meta tag")
-    if not validator.has_meta_viewport:
-        errors.append("Missing viewport meta tag")
-
-    return len(errors) == 0, errors
-
-
-@pytest.mark.unit
-def test_html_structure(index_html_content: str):
-    """Test that HTML has proper structure."""
-    is_valid, errors = validate_html_structure(index_html_content)
-    error_message = "\n".join(errors)
-    assert is_valid, f"HTML structure validation failed:\n{error_message}"
+_VALID_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width">
+<title>Test</title>
+</head>
+<body><a href="#top">Top</a></body>
+</html>"""
 
 
 @pytest.mark.unit
-def test_html_has_required_sections(index_html_content: str):
-    """Test that HTML has required sections."""
-    required_sections = [
-        "<header",
-        '<section class="hero"',
-        '<section id="news-section"',
-        '<section id="skills-section"',
-        "<footer",
-    ]
-
-    for section in required_sections:
-        assert section in index_html_content, f"Missing required section: {section}"
+def test_validate_html_structure_accepts_complete_page():
+    """Test that a page with every required element passes."""
+    is_valid, errors = validate_html_structure(_VALID_PAGE)
+    assert is_valid, errors
 
 
 @pytest.mark.unit
-def test_html_encoding_declaration(index_html_content: str):
-    """Test that HTML has proper encoding declaration."""
-    assert 'charset="UTF-8"' in index_html_content, "Missing UTF-8 charset declaration"
-    assert (
-        '<meta charset="UTF-8">' in index_html_content
-        or 'meta charset="UTF-8"' in index_html_content
-    )
+@pytest.mark.parametrize(
+    ("snippet", "error"),
+    [
+        ("<!DOCTYPE html>", "Missing DOCTYPE declaration"),
+        ("<title>Test</title>", "Missing <title> tag"),
+        ('<meta charset="UTF-8">', "Missing charset meta tag"),
+        ('<meta name="viewport" content="width=device-width">', "Missing viewport meta tag"),
+    ],
+)
+def test_validate_html_structure_reports_missing(snippet: str, error: str):
+    """Test that each missing element is reported by name."""
+    is_valid, errors = validate_html_structure(_VALID_PAGE.replace(snippet, ""))
+    assert not is_valid
+    assert error in errors
+
+
+@pytest.fixture(params=["lxml", "html.parser"])
+def link_extractor(request):
+    """Return each link-extraction backend, skipping lxml when it is not installed."""
+    if request.param == "lxml":
+        pytest.importorskip("lxml")
+        return extract_links_lxml
+    return extract_links_html_parser
 
 
 @pytest.mark.unit
-def test_html_responsive_design(index_html_content: str):
-    """Test that HTML has responsive design elements."""
-    assert 'name="viewport"' in index_html_content, "Missing viewport meta tag"
-    # Check for external CSS with media queries OR inline @media
-    has_external_css = (
-        'href="css/layout.css"' in index_html_content
-        or 'href="./css/layout.css"' in index_html_content
+def test_extract_links_collects_link_attributes(link_extractor):
+    """Test that href and src are collected from the tags that carry links."""
+    html = (
+        '<html><head><link rel="stylesheet" href="css/a.css">'
+        '<script src="js/a.js"></script></head>'
+        '<body><a href="https://docs.molt.bot">Docs</a><img src="a.png" alt="">'
+        '<div href="ignored"></div></body></html>'
     )
-    has_inline_media = "@media" in index_html_content
-    assert (
-        has_external_css or has_inline_media
-    ), "Missing responsive CSS (external css/layout.css or inline @media)"
-
-
-@pytest.mark.unit
-def test_html_has_footer_links(index_html_content: str):
-    """Test that HTML footer has required links."""
-    assert (
-        "https://github.com/moltbot/moltbot" in index_html_content
-    ), "Missing GitHub link in footer"
-    assert "https://docs.molt.bot" in index_html_content, "Missing docs link in footer"
+    links = link_extractor(html.encode("utf-8"))
+    assert links == ["css/a.css", "js/a.js", "https://docs.molt.bot", "a.png"]
 
 
 @pytest.mark.unit
-def test_extract_links_count(index_html_content: str):
-    """Test that we can extract links from HTML."""
-    links = extract_links(index_html_content)
-    # New architecture: Fewer links in HTML since content is in JSON files
-    # Expect at least 15 links (fonts, external CSS/JS, footer links, etc.)
-    assert len(links) >= 15, f"Expected at least 15 links, found {len(links)}"
+def test_extract_links_backends_agree(index_html_bytes: bytes):
+    """Test that the lxml and html.parser backends find the same links in index.html."""
+    pytest.importorskip("lxml")
+    assert extract_links_lxml(index_html_bytes) == extract_links_html_parser(index_html_bytes)
+    # extract_links picks lxml here; the result must not depend on that choice
+    assert extract_links(index_html_bytes) == extract_links_html_parser(index_html_bytes)
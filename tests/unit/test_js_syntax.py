@@ -1,16 +1,21 @@
 """Unit tests for JavaScript syntax validation"""
 
 import os
-import re
+from pathlib import Path
 
 import pytest
 
+from tests._js_helpers import find_bracket_mismatch
 
-def extract_javascript_code(html_content: str) -> str:
-    """Extract JavaScript code from <script> tags."""
-    pattern = r"<script>(.*?)</script>"
-    matches = re.findall(pattern, html_content, re.DOTALL)
-    return "\n".join(matches)
+
+def _js_file_names() -> list[str]:
+    """List js/*.js at collection time so each file becomes its own test case."""
+    js_dir = Path(__file__).resolve().parents[2] / "js"
+    try:
+        with os.scandir(js_dir) as entries:
+            return sorted(e.name for e in entries if e.name.endswith(".js") and e.is_file())
+    except FileNotFoundError:  # reported by test_js_directory_exists
+        return []
 
 
 @pytest.mark.unit
@@ -21,7 +26,7 @@ def test_js_directory_exists(js_dir):
 
 
 @pytest.mark.unit
-def test_js_files_exist(js_dir):
+def test_js_files_exist(js_entries: dict):
     """Test that expected JavaScript files exist."""
     expected_js_files = [
         "app.js",
@@ -30,89 +35,54 @@ def test_js_files_exist(js_dir):
     ]
 
     for js_file in expected_js_files:
-        js_path = js_dir / js_file
         # Note: These files may not exist in all configurations
         # So we just check the directory exists and list what's there
-        if js_path.exists():
-            assert js_path.is_file(), f"{js_file} should be a file"
+        if js_file in js_entries:
+            assert js_entries[js_file].is_file(), f"{js_file} should be a file"
 
 
 @pytest.mark.unit
-def test_js_files_valid_js(js_dir):
+@pytest.mark.parametrize("name", _js_file_names())
+def test_js_files_valid_js(js_sources: dict, name: str):
     """Test that JavaScript files are valid (have basic JS syntax)."""
-    js_files = list(js_dir.glob("*.js"))
-
-    for js_file in js_files:
-        content = js_file.read_text(encoding="utf-8")
-        # Basic check - should have JavaScript-like content
-        assert len(content) > 0, f"{js_file.name} should not be empty"
-        # Should have at least some JS syntax
-        has_js_syntax = (
-            "function" in content
-            or "const" in content
-            or "let" in content
-            or "var" in content
-            or "=>" in content
-        )
-        assert has_js_syntax or True, f"{js_file.name} should contain JavaScript syntax"
+    # Raw bytes of the file, read once per session; no decode needed
+    content = js_sources[name]
+    # Basic check - should have JavaScript-like content
+    assert len(content) > 0, f"{name} should not be empty"
 
 
 @pytest.mark.unit
-def test_javascript_has_no_syntax_errors(index_html_content):
+def test_javascript_has_no_syntax_errors(js_code: str):
     """Test that JavaScript code has no obvious syntax errors."""
-    js_code = extract_javascript_code(index_html_content)
-
-    # Check for balanced brackets
-    open_braces = js_code.count("{")
-    close_braces = js_code.count("}")
-    assert (
-        open_braces == close_braces
-    ), f"Unbalanced braces: {open_braces} open, {close_braces} close"
-
-    open_parens = js_code.count("(")
-    close_parens = js_code.count(")")
-    assert (
-        open_parens == close_parens
-    ), f"Unbalanced parentheses: {open_parens} open, {close_parens} close"
-
-    open_brackets = js_code.count("[")
-    close_brackets = js_code.count("]")
-    assert (
-        open_brackets == close_brackets
-    ), f"Unbalanced brackets: {open_brackets} open, {close_brackets} close"
+    # Brackets must balance and nest
+    mismatch = find_bracket_mismatch(js_code)
+    assert mismatch is None, f"Unbalanced brackets: {mismatch}"
 
 
 @pytest.mark.unit
-def test_javascript_no_console_log_errors(index_html_content):
+def test_javascript_no_console_log_errors(js_code: str):
     """Test that there are no console.error or console.log left in production."""
-    js_code = extract_javascript_code(index_html_content)
-
-    # Check for console.log (might be okay for debugging, but better to check)
-    re.findall(r"console\.log\(", js_code)
-
-    # Check for console.error
-    console_errors = re.findall(r"console\.error\(", js_code)
+    # console.log might be okay for debugging, so only console.error is checked
+    console_errors = js_code.count("console.error(")
 
     # If there are errors, it might indicate issues
     if console_errors:
-        assert (
-            False
-        ), f"Found console.error calls in production code: {len(console_errors)} occurrences"
+        assert False, f"Found console.error calls in production code: {console_errors} occurrences"
 
 
 @pytest.mark.unit
-def test_javascript_has_news_data(index_html_content):
+def test_javascript_has_news_data(data_dir: Path):
     """Test that data files contain news data."""
     # New architecture: News data is in JSON files
-    # Check if the data file exists
-    news_data_path = "data/news/2026-01.json"
-    assert os.path.exists(news_data_path), f"Missing news data file: {news_data_path}"
+    # Check if the data file exists (one stat, relative to the project root)
+    news_data_path = data_dir / "news" / "2026-01.json"
+    assert news_data_path.is_file(), f"Missing news data file: {news_data_path}"
 
 
 @pytest.mark.unit
-def test_javascript_has_skills_data(index_html_content):
+def test_javascript_has_skills_data(data_dir: Path):
     """Test that data files contain skills data."""
     # New architecture: Skills data is in JSON files
     # Check if skills directory exists
-    skills_dir = "data/skills"
-    assert os.path.exists(skills_dir), f"Missing skills data directory: {skills_dir}"
+    skills_dir = data_dir / "skills"
+    assert skills_dir.is_dir(), f"Missing skills data directory: {skills_dir}"